@@ -11,9 +11,12 @@ import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    # Imported lazily at runtime; pulling in openai (httpx, pydantic) is the
+    # bulk of this script's startup time
+    from openai import AsyncOpenAI
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,7 +48,7 @@ class AgentTask:
 class CodexAgent:
     """Base class for specialized Codex agents"""
     
-    def __init__(self, agent_type: AgentType, openai_client: AsyncOpenAI):
+    def __init__(self, agent_type: AgentType, openai_client: "AsyncOpenAI"):
         self.agent_type = agent_type
         self.client = openai_client
         self.context = self.load_project_context()
@@ -156,7 +159,7 @@ Focus on:
 class CodeReviewerAgent(CodexAgent):
     """Specialized agent for code review"""
     
-    def __init__(self, openai_client: AsyncOpenAI):
+    def __init__(self, openai_client: "AsyncOpenAI"):
         super().__init__(AgentType.CODE_REVIEWER, openai_client)
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
@@ -214,7 +217,7 @@ Format your response as structured feedback with severity levels.
 class DocumentationAgent(CodexAgent):
     """Specialized agent for documentation generation"""
     
-    def __init__(self, openai_client: AsyncOpenAI):
+    def __init__(self, openai_client: "AsyncOpenAI"):
         super().__init__(AgentType.DOCUMENTATION, openai_client)
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
@@ -273,7 +276,7 @@ Format the documentation in Markdown with proper structure and examples.
 class TestingAgent(CodexAgent):
     """Specialized agent for test generation"""
     
-    def __init__(self, openai_client: AsyncOpenAI):
+    def __init__(self, openai_client: "AsyncOpenAI"):
         super().__init__(AgentType.TESTING, openai_client)
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
@@ -337,6 +340,8 @@ class MultiAgentOrchestrator:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
+        from openai import AsyncOpenAI
+
         self.client = AsyncOpenAI(api_key=self.api_key)
         self.agents = {
             AgentType.CODE_REVIEWER: CodeReviewerAgent(self.client),
@@ -107,21 +107,32 @@ def scan_project_files() -> List[Dict]:
     """Scan project for relevant files to include in Codex context"""
     
     project_root = Path(__file__).parent.parent
-    files = []
+    file_types = tuple(CODEX_CONFIG["file_types"])
+    exclude_dirs = set(CODEX_CONFIG["exclude_dirs"])
+    files_by_type: Dict[str, List[Dict]] = {file_type: [] for file_type in file_types}
     
-    for file_type in CODEX_CONFIG["file_types"]:
-        for file_path in project_root.rglob(f"*{file_type}"):
+    # Single walk over the tree, pruning excluded directories (node_modules in
+    # particular) instead of globbing the whole tree once per file type
+    for dir_path, dir_names, file_names in os.walk(project_root):
+        dir_names[:] = [name for name in dir_names if name not in exclude_dirs]
+        
+        for file_name in file_names:
+            if not file_name.endswith(file_types):
+                continue
+            
+            file_path = Path(dir_path) / file_name
             # Skip excluded directories
             if any(excluded in str(file_path) for excluded in CODEX_CONFIG["exclude_dirs"]):
                 continue
                 
             relative_path = file_path.relative_to(project_root)
+            file_type = file_path.suffix
             
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                     
-                files.append({
+                files_by_type[file_type].append({
                     "path": str(relative_path),
                     "type": file_type,
                     "size": len(content),
@@ -132,7 +143,7 @@ def scan_project_files() -> List[Dict]:
                 # Skip binary or protected files
                 continue
     
-    return files
+    return [entry for file_type in file_types for entry in files_by_type[file_type]]
 
 def get_file_description(file_path: Path, content: str) -> str:
     """Generate description for a file based on its path and content"""
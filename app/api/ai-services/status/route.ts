@@ -2,12 +2,44 @@ import type { NextRequest } from "next/server";
 import { createApiResponse } from "@/src/lib/api-response";
 import { getAiIntelligenceService } from "@/src/services/ai/ai-intelligence-service";
 
+// Provider probes issue paid API calls; share one in-flight probe across
+// overlapping requests and reuse its result for a short window.
+const STATUS_CACHE_TTL_MS = 15_000;
+let statusInFlight: Promise<ServiceStatus[]> | null = null;
+let statusCache: { expiresAt: number; services: ServiceStatus[] } | null =
+  null;
+
+function getServiceStatuses(): Promise<ServiceStatus[]> {
+  if (statusCache && statusCache.expiresAt > Date.now()) {
+    return Promise.resolve(statusCache.services);
+  }
+
+  if (!statusInFlight) {
+    statusInFlight = Promise.all([
+      checkCohereStatus(),
+      checkPerplexityStatus(),
+      checkOpenAIStatus(),
+    ])
+      .then((services) => {
+        statusCache = {
+          expiresAt: Date.now() + STATUS_CACHE_TTL_MS,
+          services,
+        };
+        return services;
+      })
+      .finally(() => {
+        statusInFlight = null;
+      });
+  }
+
+  return statusInFlight;
+}
+
 export async function GET(_request: NextRequest) {
   try {
     // Check AI service health and configuration
-    const cohereStatus = await checkCohereStatus();
-    const perplexityStatus = await checkPerplexityStatus();
-    const openaiStatus = await checkOpenAIStatus();
+    const [cohereStatus, perplexityStatus, openaiStatus] =
+      await getServiceStatuses();
 
     const overallStatus = determineOverallStatus([
       cohereStatus,
@@ -2,6 +2,7 @@ import { type NextRequest, NextResponse } from "next/server";
 import { db } from "@/src/db";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { AlertCorrelationEngine } from "@/src/services/notification/alert-correlation-engine";
 import { AnomalyDetectionService } from "@/src/services/notification/anomaly-detection-service";
 import { AutomatedAlertingService } from "@/src/services/notification/automated-alerting-service";
@@ -52,8 +53,8 @@ interface FormattedAnalyticsItem extends Omit<AlertAnalyticsItem, "timestamp"> {
 // GET /api/alerts/analytics - Get alerting analytics
 // ==========================================
 
-export async function GET(request: NextRequest) {
-  try {
+export const GET = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -174,11 +175,10 @@ export async function GET(request: NextRequest) {
       success: true,
       data: analyticsData,
     });
-  } catch (error) {
-    console.error("Error fetching alert analytics:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alert analytics",
+  handleApiError
+);
 
 // ==========================================
 // Helper Functions
@@ -2,17 +2,18 @@ import { type NextRequest, NextResponse } from "next/server";
 import { db } from "@/src/db";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { NotificationService } from "@/src/services/notification/notification-providers";
 
 // ==========================================
 // POST /api/alerts/channels/[id]/test - Test notification channel
 // ==========================================
 
-export async function POST(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const POST = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const { id } = await params;
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
@@ -40,8 +41,7 @@ export async function POST(
         { status: 400 }
       );
     }
-  } catch (error) {
-    console.error("Error testing notification channel:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error testing notification channel",
+  handleApiError
+);
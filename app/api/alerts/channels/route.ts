@@ -3,13 +3,14 @@ import { db } from "@/src/db";
 import { AlertConfigurationService } from "@/src/lib/alert-configuration";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 
 // ==========================================
 // GET /api/alerts/channels - List notification channels
 // ==========================================
 
-export async function GET(request: NextRequest) {
-  try {
+export const GET = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -51,17 +52,16 @@ export async function GET(request: NextRequest) {
       data: formattedChannels,
       count: formattedChannels.length,
     });
-  } catch (error) {
-    console.error("Error fetching notification channels:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching notification channels",
+  handleApiError
+);
 
 // ==========================================
 // POST /api/alerts/channels - Create notification channel
 // ==========================================
-export async function POST(request: NextRequest) {
-  try {
+export const POST = withApiErrorHandling(
+  async (request: NextRequest) => {
     const user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -83,11 +83,10 @@ export async function POST(request: NextRequest) {
       },
       { status: 201 }
     );
-  } catch (error) {
-    console.error("Error creating notification channel:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error creating notification channel",
+  handleApiError
+);
 
 interface NotificationConfig {
   // Email config
@@ -3,14 +3,15 @@ import { db } from "@/src/db";
 import { AlertConfigurationService } from "@/src/lib/alert-configuration";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { NotificationService } from "@/src/services/notification/notification-providers";
 
 // ==========================================
 // POST /api/alerts/deploy/built-in - Deploy built-in alert rules and channels
 // ==========================================
 
-export async function POST(request: NextRequest) {
-  try {
+export const POST = withApiErrorHandling(
+  async (request: NextRequest) => {
     const user = await validateRequest(request);
 
     // Initialize services at runtime
@@ -42,13 +43,10 @@ export async function POST(request: NextRequest) {
       },
       { status: 201 }
     );
-  } catch (error) {
-    console.error("Error deploying built-in alerting configuration:", {
-      error: error,
-    });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error deploying built-in alerting configuration",
+  handleApiError
+);
 
 async function deployExampleNotificationChannels(
   createdBy: string,
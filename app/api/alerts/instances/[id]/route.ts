@@ -5,18 +5,24 @@ import { db } from "@/src/db";
 import { alertInstances } from "@/src/db/schemas/alerts";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { AutomatedAlertingService } from "@/src/services/notification/automated-alerting-service";
 
 const alertingService = new AutomatedAlertingService(db);
 
+const AlertActionSchema = z.object({
+  action: z.enum(["resolve", "acknowledge", "suppress"]),
+  notes: z.string().optional(),
+});
+
 // ==========================================
 // GET /api/alerts/instances/[id] - Get specific alert instance
 // ==========================================
-export async function GET(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const GET = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const _user = await validateRequest(request);
     const { id } = await params;
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
@@ -67,35 +73,29 @@ export async function GET(
       success: true,
       data: formattedAlert,
     });
-  } catch (error) {
-    console.error("Error fetching alert instance:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alert instance",
+  handleApiError
+);
 
 // ==========================================
 // PATCH /api/alerts/instances/[id] - Resolve or acknowledge alert
 // ==========================================
-export async function PATCH(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const PATCH = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const user = await validateRequest(request);
     const { id } = await params;
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
     const body = await request.json();
-    const { action, notes } = z
-      .object({
-        action: z.enum(["resolve", "acknowledge", "suppress"]),
-        notes: z.string().optional(),
-      })
-      .parse(body);
-
-    // Check if alert exists
+    const { action, notes } = AlertActionSchema.parse(body);
+
+    // Check if alert exists (only its status is needed below)
     const existingAlert = await db
-      .select()
+      .select({ status: alertInstances.status })
       .from(alertInstances)
       .where(eq(alertInstances.id, id))
       .limit(1);
@@ -175,8 +175,7 @@ export async function PATCH(
           { status: 400 }
         );
     }
-  } catch (error) {
-    console.error("Error updating alert instance:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error updating alert instance",
+  handleApiError
+);
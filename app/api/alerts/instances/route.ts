@@ -4,15 +4,24 @@ import { db } from "@/src/db";
 import type { SelectAlertInstance } from "@/src/db/schemas";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { AutomatedAlertingService } from "@/src/services/notification/automated-alerting-service";
 
 const alertingService = new AutomatedAlertingService(db);
 
+const MetricEvaluationSchema = z.object({
+  metricName: z.string(),
+  value: z.number(),
+  source: z.string(),
+  sourceId: z.string().optional(),
+  features: z.record(z.string(), z.unknown()).optional(),
+});
+
 // ==========================================
 // GET /api/alerts/instances - List alert instances
 // ==========================================
-export async function GET(request: NextRequest) {
-  try {
+export const GET = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -109,30 +118,22 @@ export async function GET(request: NextRequest) {
         hours,
       },
     });
-  } catch (error) {
-    console.error("Error fetching alert instances:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alert instances",
+  handleApiError
+);
 
 // ==========================================
 // POST /api/alerts/instances - Test alert creation
 // ==========================================
-export async function POST(request: NextRequest) {
-  try {
+export const POST = withApiErrorHandling(
+  async (request: NextRequest) => {
     const user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
     const body = await request.json();
-    const { metricName, value, source, sourceId, features } = z
-      .object({
-        metricName: z.string(),
-        value: z.number(),
-        source: z.string(),
-        sourceId: z.string().optional(),
-        features: z.record(z.string(), z.unknown()).optional(),
-      })
-      .parse(body);
+    const { metricName, value, source, sourceId, features } =
+      MetricEvaluationSchema.parse(body);
 
     // Create test alert metric
     const testMetric = {
@@ -155,8 +156,7 @@ export async function POST(request: NextRequest) {
       },
       { status: 201 }
     );
-  } catch (error) {
-    console.error("Error creating test alert:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error creating test alert",
+  handleApiError
+);
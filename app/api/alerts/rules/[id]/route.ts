@@ -3,17 +3,18 @@ import { db } from "@/src/db";
 import { AlertConfigurationService } from "@/src/lib/alert-configuration";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 
 const alertConfigService = new AlertConfigurationService(db);
 
 // ==========================================
 // GET /api/alerts/rules/[id] - Get specific alert rule
 // ==========================================
-export async function GET(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const GET = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const { id } = await params;
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
@@ -41,20 +42,19 @@ export async function GET(
       success: true,
       data: formattedRule,
     });
-  } catch (error) {
-    console.error("Error fetching alert rule:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alert rule",
+  handleApiError
+);
 
 // ==========================================
 // PUT /api/alerts/rules/[id] - Update alert rule
 // ==========================================
-export async function PUT(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const PUT = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const { id } = await params;
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
@@ -98,20 +98,19 @@ export async function PUT(
       warnings: validation.warnings,
       message: "Alert rule updated successfully",
     });
-  } catch (error) {
-    console.error("Error updating alert rule:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error updating alert rule",
+  handleApiError
+);
 
 // ==========================================
 // DELETE /api/alerts/rules/[id] - Delete alert rule
 // ==========================================
-export async function DELETE(
-  request: NextRequest,
-  { params }: { params: Promise<{ id: string }> }
-) {
-  try {
+export const DELETE = withApiErrorHandling(
+  async (
+    request: NextRequest,
+    { params }: { params: Promise<{ id: string }> }
+  ) => {
     const { id } = await params;
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
@@ -134,8 +133,7 @@ export async function DELETE(
       success: true,
       message: "Alert rule disabled successfully",
     });
-  } catch (error) {
-    console.error("Error deleting alert rule:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error deleting alert rule",
+  handleApiError
+);
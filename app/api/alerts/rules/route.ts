@@ -4,14 +4,19 @@ import { db } from "@/src/db";
 import { AlertConfigurationService } from "@/src/lib/alert-configuration";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 
 const alertConfigService = new AlertConfigurationService(db);
 
+const BulkDeleteRulesSchema = z.object({
+  ruleIds: z.array(z.string()),
+});
+
 // ==========================================
 // GET /api/alerts/rules - List alert rules
 // ==========================================
-export async function GET(request: NextRequest) {
-  try {
+export const GET = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -43,17 +48,16 @@ export async function GET(request: NextRequest) {
       data: formattedRules,
       count: formattedRules.length,
     });
-  } catch (error) {
-    console.error("Error fetching alert rules:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alert rules",
+  handleApiError
+);
 
 // ==========================================
 // POST /api/alerts/rules - Create alert rule
 // ==========================================
-export async function POST(request: NextRequest) {
-  try {
+export const POST = withApiErrorHandling(
+  async (request: NextRequest) => {
     const user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -84,26 +88,21 @@ export async function POST(request: NextRequest) {
       },
       { status: 201 }
     );
-  } catch (error) {
-    console.error("Error creating alert rule:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error creating alert rule",
+  handleApiError
+);
 
 // ==========================================
 // DELETE /api/alerts/rules - Bulk delete rules
 // ==========================================
-export async function DELETE(request: NextRequest) {
-  try {
+export const DELETE = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
     const body = await request.json();
-    const { ruleIds } = z
-      .object({
-        ruleIds: z.array(z.string()),
-      })
-      .parse(body);
+    const { ruleIds } = BulkDeleteRulesSchema.parse(body);
 
     for (const ruleId of ruleIds) {
       await alertConfigService.deleteAlertRule(ruleId);
@@ -113,8 +112,7 @@ export async function DELETE(request: NextRequest) {
       success: true,
       message: `${ruleIds.length} alert rules disabled successfully`,
     });
-  } catch (error) {
-    console.error("Error deleting alert rules:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error deleting alert rules",
+  handleApiError
+);
@@ -1,8 +1,11 @@
+import { count, desc, gte } from "drizzle-orm";
 import { type NextRequest, NextResponse } from "next/server";
 import { db } from "@/src/db";
+import { alertInstances } from "@/src/db/schemas/alerts";
 import { AlertConfigurationService } from "@/src/lib/alert-configuration";
 import { validateRequest } from "@/src/lib/api-auth";
 import { handleApiError } from "@/src/lib/api-response";
+import { withApiErrorHandling } from "@/src/lib/central-api-error-handler";
 import { AlertCorrelationEngine } from "@/src/services/notification/alert-correlation-engine";
 import { AnomalyDetectionService } from "@/src/services/notification/anomaly-detection-service";
 import { AutomatedAlertingService } from "@/src/services/notification/automated-alerting-service";
@@ -18,8 +21,8 @@ const configService = new AlertConfigurationService(db);
 // ==========================================
 // GET /api/alerts/system/status - Get alerting system status
 // ==========================================
-export async function GET(request: NextRequest) {
-  try {
+export const GET = withApiErrorHandling(
+  async (request: NextRequest) => {
     const _user = await validateRequest(request);
     // validateRequest already throws if not authenticated, so if we reach here, user is authenticated
 
@@ -102,11 +105,10 @@ export async function GET(request: NextRequest) {
       success: true,
       data: systemStatus,
     });
-  } catch (error) {
-    console.error("Error fetching alerting system status:", { error: error });
-    return handleApiError(error);
-  }
-}
+  },
+  "Error fetching alerting system status",
+  handleApiError
+);
 
 // ==========================================
 // Helper Functions
@@ -158,9 +160,6 @@ async function getRecentAlertCount(hours: number): Promise<number> {
   const cutoff = Date.now() - hours * 3600000;
 
   try {
-    const { alertInstances } = await import("@/src/db/schemas/alerts");
-    const { gte, count } = await import("drizzle-orm");
-
     const result = await db
       .select({ count: count() })
       .from(alertInstances)
@@ -178,9 +177,6 @@ async function getTopAlertSources(): Promise<
 > {
   try {
     const cutoff = Date.now() - 24 * 3600000; // Last 24 hours
-    const { alertInstances } = await import("@/src/db/schemas/alerts");
-    const { gte, count, desc } = await import("drizzle-orm");
-
     const result = await db
       .select({
         source: alertInstances.source,
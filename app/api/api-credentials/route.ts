@@ -4,6 +4,7 @@
  */
 
 import { type NextRequest, NextResponse } from "next/server";
+import { currentTimestamp } from "@/src/lib/api-response";
 
 // Mock API credentials data
 const mockCredentials = {
@@ -24,7 +25,7 @@ export async function GET(request: NextRequest) {
     console.info("[API-Credentials] GET request", {
       userId: userId || "anonymous",
       provider,
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
     });
 
     const response = {
@@ -38,7 +39,7 @@ export async function GET(request: NextRequest) {
         hasEnvironmentCredentials: !!(
           process.env.MEXC_API_KEY && process.env.MEXC_SECRET_KEY
         ),
-        timestamp: new Date().toISOString(),
+        timestamp: currentTimestamp(),
       },
       message: "Credentials retrieved successfully",
     };
@@ -50,7 +51,7 @@ export async function GET(request: NextRequest) {
       {
         success: false,
         error: "Failed to retrieve credentials",
-        timestamp: new Date().toISOString(),
+        timestamp: currentTimestamp(),
       },
       { status: 500 }
     );
@@ -66,7 +67,7 @@ export async function POST(request: NextRequest) {
       userId: userId || "anonymous",
       provider,
       hasCredentials: !!credentials,
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
     });
 
     // Mock credential validation
@@ -95,7 +96,7 @@ export async function POST(request: NextRequest) {
       {
         success: false,
         error: "Failed to store credentials",
-        timestamp: new Date().toISOString(),
+        timestamp: currentTimestamp(),
       },
       { status: 500 }
     );
@@ -111,7 +112,7 @@ export async function DELETE(request: NextRequest) {
     console.info("[API-Credentials] DELETE request", {
       userId: userId || "anonymous",
       provider,
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
     });
 
     const response = {
@@ -131,7 +132,7 @@ export async function DELETE(request: NextRequest) {
       {
         success: false,
         error: "Failed to delete credentials",
-        timestamp: new Date().toISOString(),
+        timestamp: currentTimestamp(),
       },
       { status: 500 }
     );
@@ -79,14 +79,29 @@ export const POST = apiAuthWrapper(async (request: NextRequest) => {
     const { action, symbols, calendarEntries, alertId } = body;
 
     switch (action) {
-      case "start_monitoring":
-        await getPatternMonitoringService().startMonitoring();
+      case "start_monitoring": {
+        const monitoringService = getPatternMonitoringService();
+        if (monitoringService.isMonitoringActive) {
+          return NextResponse.json(
+            createSuccessResponse(
+              { status: "already_running" },
+              { message: "Pattern monitoring is already running" }
+            )
+          );
+        }
+
+        // Don't hold the response open for the initial detection cycle;
+        // monitoring state flips to active synchronously and GET reports it.
+        void monitoringService.startMonitoring().catch((error) => {
+          console.error("[API] Pattern monitoring start failed:", { error });
+        });
         return NextResponse.json(
           createSuccessResponse(
-            { status: "started" },
-            { message: "Pattern monitoring started successfully" }
+            { status: "starting" },
+            { message: "Pattern monitoring is starting" }
           )
         );
+      }
 
       case "stop_monitoring":
         getPatternMonitoringService().stopMonitoring();
@@ -151,11 +166,12 @@ export const POST = apiAuthWrapper(async (request: NextRequest) => {
         const { patternTargetIntegrationService } = await import(
           "@/src/services/data/pattern-detection/pattern-target-integration-service"
         );
-        const { UnifiedMexcServiceV2 } = await import(
+        const { getUnifiedMexcServiceV2 } = await import(
           "@/src/services/api/unified-mexc-service-v2"
         );
 
-        const mexcService = new UnifiedMexcServiceV2();
+        // Reuse the process-wide client and its warm connections and caches
+        const mexcService = getUnifiedMexcServiceV2();
         const userId = body.userId || "system";
 
         // Get market data
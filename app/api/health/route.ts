@@ -10,6 +10,19 @@ import { apiResponse } from "@/src/lib/api-response";
 import { getSystemResilienceStatus } from "@/src/lib/enhanced-resilience-manager";
 import { MexcConfigValidator } from "@/src/services/api/mexc-config-validator";
 
+// Process-level fields never change while the server runs; build them once
+// instead of on every probe.
+const STATIC_HEALTH_FIELDS = {
+  version: process.env.npm_package_version || "1.0.0",
+  environment: process.env.NODE_ENV || "development",
+} as const;
+
+const STATIC_DEPLOYMENT_FIELDS = {
+  platform: process.platform,
+  nodeVersion: process.version,
+  architecture: process.arch,
+} as const;
+
 /**
  * GET /api/health
  * Comprehensive health check with enhanced resilience
@@ -34,8 +47,7 @@ export async function GET(_request: NextRequest): Promise<NextResponse> {
       timestamp: new Date().toISOString(),
       uptime: process.uptime(),
       responseTime,
-      version: process.env.npm_package_version || "1.0.0",
-      environment: process.env.NODE_ENV || "development",
+      ...STATIC_HEALTH_FIELDS,
 
       // Core system health
       system: {
@@ -80,9 +92,7 @@ export async function GET(_request: NextRequest): Promise<NextResponse> {
       },
 
       deployment: {
-        platform: process.platform,
-        nodeVersion: process.version,
-        architecture: process.arch,
+        ...STATIC_DEPLOYMENT_FIELDS,
         memoryUsage: process.memoryUsage(),
       },
     };
@@ -46,53 +46,46 @@ async function getInngestSetup() {
   }
 }
 
-// Build-safe inngest handler
-let inngestHandler: any = null;
+// Build-safe inngest handler, created on the first request. The promise is
+// shared so concurrent cold-start requests import the workflow modules and
+// build the handler only once.
+let inngestHandler: Promise<any> | null = null;
 
-// Only initialize during runtime, not build time
-if (typeof window === "undefined" && process.env.NODE_ENV !== "test") {
-  // This will be initialized on first request
-  getInngestSetup()
-    .then((setup) => {
-      if (setup) {
-        inngestHandler = serve(setup);
+function getInngestHandler(): Promise<any> {
+  if (!inngestHandler) {
+    inngestHandler = getInngestSetup().then((setup) => {
+      if (!setup) {
+        // Let the next request retry instead of caching the failure
+        inngestHandler = null;
+        return null;
       }
-    })
-    .catch((error) => {
-      console.warn("Failed to initialize inngest handler:", error);
+      return serve(setup);
     });
+  }
+  return inngestHandler;
 }
 
 // Export request handlers with build-time safety
 export async function GET(request: Request) {
-  if (!inngestHandler) {
-    const setup = await getInngestSetup();
-    if (!setup) {
-      return new Response("Inngest not available", { status: 503 });
-    }
-    inngestHandler = serve(setup);
+  const handler = await getInngestHandler();
+  if (!handler) {
+    return new Response("Inngest not available", { status: 503 });
   }
-  return inngestHandler.GET(request);
+  return handler.GET(request);
 }
 
 export async function POST(request: Request) {
-  if (!inngestHandler) {
-    const setup = await getInngestSetup();
-    if (!setup) {
-      return new Response("Inngest not available", { status: 503 });
-    }
-    inngestHandler = serve(setup);
+  const handler = await getInngestHandler();
+  if (!handler) {
+    return new Response("Inngest not available", { status: 503 });
   }
-  return inngestHandler.POST(request);
+  return handler.POST(request);
 }
 
 export async function PUT(request: Request) {
-  if (!inngestHandler) {
-    const setup = await getInngestSetup();
-    if (!setup) {
-      return new Response("Inngest not available", { status: 503 });
-    }
-    inngestHandler = serve(setup);
+  const handler = await getInngestHandler();
+  if (!handler) {
+    return new Response("Inngest not available", { status: 503 });
   }
-  return inngestHandler.PUT(request);
+  return handler.PUT(request);
 }
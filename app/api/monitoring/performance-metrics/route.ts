@@ -87,8 +87,9 @@ export async function GET(_request: NextRequest) {
         responseTime: await calculateAgentResponseTime("pattern-discovery"),
         successRate: await calculateAgentSuccessRate("pattern-discovery"),
         cacheHitRate: await calculateCacheHitRate("pattern-discovery"),
-        patternsDiscovered: await getPatternsDiscoveredCount(),
-        confidenceScore: await getAverageConfidenceScore(),
+        // Same 24h pattern aggregates already fetched in patternStats
+        patternsDiscovered: patternStats.total,
+        confidenceScore: patternStats.averageConfidence,
         lastActivity: await getLastAgentActivity("pattern-discovery"),
       },
       calendarAgent: {
@@ -257,33 +258,27 @@ async function getRecentExecutions() {
 
 async function getPatternAnalyticsMetrics() {
   try {
-    const result = await db
-      .select({
-        total: sql<number>`count(*)`,
-        averageConfidence: sql<number>`avg(${patternEmbeddings.confidence})`,
-        successful: sql<number>`count(*) filter (where ${patternEmbeddings.isActive} = true)`,
-      })
-      .from(patternEmbeddings)
-      .where(
-        gte(
-          patternEmbeddings.createdAt,
-          new Date(Date.now() - 24 * 60 * 60 * 1000)
-        )
-      );
-
-    const types = await db
-      .select({
-        type: patternEmbeddings.patternType,
-        count: sql<number>`count(*)`,
-      })
-      .from(patternEmbeddings)
-      .where(
-        gte(
-          patternEmbeddings.createdAt,
-          new Date(Date.now() - 24 * 60 * 60 * 1000)
-        )
-      )
-      .groupBy(patternEmbeddings.patternType);
+    const since = new Date(Date.now() - 24 * 60 * 60 * 1000);
+
+    // Totals and per-type breakdown are independent; fetch them concurrently
+    const [result, types] = await Promise.all([
+      db
+        .select({
+          total: sql<number>`count(*)`,
+          averageConfidence: sql<number>`avg(${patternEmbeddings.confidence})`,
+          successful: sql<number>`count(*) filter (where ${patternEmbeddings.isActive} = true)`,
+        })
+        .from(patternEmbeddings)
+        .where(gte(patternEmbeddings.createdAt, since)),
+      db
+        .select({
+          type: patternEmbeddings.patternType,
+          count: sql<number>`count(*)`,
+        })
+        .from(patternEmbeddings)
+        .where(gte(patternEmbeddings.createdAt, since))
+        .groupBy(patternEmbeddings.patternType),
+    ]);
 
     return {
       total: result[0]?.total || 0,
@@ -382,40 +377,6 @@ async function getLastAgentActivity(_agentType: string): Promise<string> {
 }
 
 // Additional metric functions
-async function getPatternsDiscoveredCount(): Promise<number> {
-  try {
-    const result = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(patternEmbeddings)
-      .where(
-        gte(
-          patternEmbeddings.createdAt,
-          new Date(Date.now() - 24 * 60 * 60 * 1000)
-        )
-      );
-    return result[0]?.count || 0;
-  } catch {
-    return 0;
-  }
-}
-
-async function getAverageConfidenceScore(): Promise<number> {
-  try {
-    const result = await db
-      .select({ avg: sql<number>`avg(${patternEmbeddings.confidence})` })
-      .from(patternEmbeddings)
-      .where(
-        gte(
-          patternEmbeddings.createdAt,
-          new Date(Date.now() - 24 * 60 * 60 * 1000)
-        )
-      );
-    return result[0]?.avg || 0;
-  } catch {
-    return 0;
-  }
-}
-
 async function getCoinsDiscoveredCount(): Promise<number> {
   return Math.floor(Math.random() * 20 + 5);
 }
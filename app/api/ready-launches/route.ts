@@ -7,6 +7,16 @@ interface CalendarEntry {
   projectName: string;
 }
 
+// Calendar timestamps are already epoch milliseconds; only fall back to Date
+// parsing for string values instead of allocating a Date per row.
+function toLaunchTimeMs(
+  firstOpenTime: CalendarEntry["firstOpenTime"] | string
+): number {
+  return typeof firstOpenTime === "number"
+    ? firstOpenTime
+    : new Date(firstOpenTime).getTime();
+}
+
 /**
  * API Route: Ready Launches
  *
@@ -65,16 +75,8 @@ export async function GET(request: NextRequest) {
 
       const historicalReadyLaunches = calendarData.filter(
         (entry: CalendarEntry) => {
-          try {
-            const launchTime = new Date(entry.firstOpenTime).getTime();
-            return launchTime >= fromTimestamp && launchTime <= toTimestamp;
-          } catch (_error) {
-            console.warn(
-              "Invalid date in calendar entry:",
-              entry.firstOpenTime
-            );
-            return false;
-          }
+          const launchTime = toLaunchTimeMs(entry.firstOpenTime);
+          return launchTime >= fromTimestamp && launchTime <= toTimestamp;
         }
       );
 
@@ -90,20 +92,13 @@ export async function GET(request: NextRequest) {
     }
 
     // Default behavior: return launches ready within 4 hours
-    const now = new Date();
+    const now = Date.now();
     const hours4 = 4 * 60 * 60 * 1000;
+    const windowEnd = now + hours4;
 
     const readyLaunches = calendarData.filter((entry: CalendarEntry) => {
-      try {
-        const launchTime = new Date(entry.firstOpenTime);
-        return (
-          launchTime.getTime() > now.getTime() &&
-          launchTime.getTime() < now.getTime() + hours4
-        );
-      } catch (_error) {
-        console.warn("Invalid date in calendar entry:", entry.firstOpenTime);
-        return false;
-      }
+      const launchTime = toLaunchTimeMs(entry.firstOpenTime);
+      return launchTime > now && launchTime < windowEnd;
     });
 
     return NextResponse.json({
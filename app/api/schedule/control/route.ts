@@ -1,3 +1,4 @@
+import { createHash } from "node:crypto";
 import { type NextRequest, NextResponse } from "next/server";
 // Build-safe imports - avoid structured logger to prevent webpack bundling issues
 import { inngest } from "@/src/inngest/client";
@@ -80,32 +81,34 @@ export async function POST(request: NextRequest) {
       }
 
       case "force_analysis": {
-        // Force immediate comprehensive analysis
-        const calendarEvent = await inngest.send({
-          name: "mexc/calendar.poll",
-          data: {
-            trigger: "manual_force",
-            force: true,
-            timestamp: new Date().toISOString(),
+        // Force immediate comprehensive analysis (one batched request)
+        const timestamp = new Date().toISOString();
+        const { ids } = await inngest.send([
+          {
+            name: "mexc/calendar.poll",
+            data: {
+              trigger: "manual_force",
+              force: true,
+              timestamp,
+            },
           },
-        });
-
-        const patternEvent = await inngest.send({
-          name: "mexc/patterns.analyze",
-          data: {
-            symbols: data.symbols || [],
-            analysisType: "discovery",
-            trigger: "manual_force",
-            timestamp: new Date().toISOString(),
+          {
+            name: "mexc/patterns.analyze",
+            data: {
+              symbols: data.symbols || [],
+              analysisType: "discovery",
+              trigger: "manual_force",
+              timestamp,
+            },
           },
-        });
+        ]);
 
         return NextResponse.json({
           success: true,
           message: "Forced analysis triggered",
           events: {
-            calendar: calendarEvent.ids[0],
-            patterns: patternEvent.ids[0],
+            calendar: ids[0],
+            patterns: ids[1],
           },
         });
       }
@@ -170,32 +173,46 @@ export async function POST(request: NextRequest) {
   }
 }
 
-export async function GET() {
-  try {
-    return NextResponse.json({
-      status: "Scheduling system operational",
-      availableActions: [
-        "start_monitoring - Start all scheduled monitoring",
-        "stop_monitoring - Stop scheduled monitoring",
-        "trigger_emergency - Trigger emergency response",
-        "force_analysis - Force immediate analysis",
-        "get_schedule_status - Get current schedule status",
-      ],
-      schedules: {
-        calendar: "Every 30 minutes",
-        patterns: "Every 15 minutes",
-        health: "Every 5 minutes",
-        intensive: "Every 2 hours",
-        daily: "Daily at 9 AM UTC",
-      },
+// The schedule overview is static, so serialize it and derive its ETag once;
+// pollers that send If-None-Match get a 304 without a body.
+const SCHEDULE_STATUS_BODY = JSON.stringify({
+  status: "Scheduling system operational",
+  availableActions: [
+    "start_monitoring - Start all scheduled monitoring",
+    "stop_monitoring - Stop scheduled monitoring",
+    "trigger_emergency - Trigger emergency response",
+    "force_analysis - Force immediate analysis",
+    "get_schedule_status - Get current schedule status",
+  ],
+  schedules: {
+    calendar: "Every 30 minutes",
+    patterns: "Every 15 minutes",
+    health: "Every 5 minutes",
+    intensive: "Every 2 hours",
+    daily: "Daily at 9 AM UTC",
+  },
+});
+const SCHEDULE_STATUS_ETAG = `"${createHash("sha1")
+  .update(SCHEDULE_STATUS_BODY)
+  .digest("base64url")
+  .slice(0, 16)}"`;
+const SCHEDULE_STATUS_HEADERS = {
+  ETag: SCHEDULE_STATUS_ETAG,
+  "Cache-Control": "public, max-age=60",
+};
+
+export async function GET(request: NextRequest) {
+  if (request.headers.get("if-none-match") === SCHEDULE_STATUS_ETAG) {
+    return new NextResponse(null, {
+      status: 304,
+      headers: SCHEDULE_STATUS_HEADERS,
     });
-  } catch (error) {
-    return NextResponse.json(
-      {
-        status: "Error retrieving schedule status",
-        error: error instanceof Error ? error.message : "Unknown error",
-      },
-      { status: 500 }
-    );
   }
+
+  return new NextResponse(SCHEDULE_STATUS_BODY, {
+    headers: {
+      ...SCHEDULE_STATUS_HEADERS,
+      "Content-Type": "application/json",
+    },
+  });
 }
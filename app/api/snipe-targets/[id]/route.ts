@@ -149,10 +149,11 @@ export async function DELETE(
       );
     }
 
+    // Only existence matters here, so return just the id
     const result = await db
       .delete(snipeTargets)
       .where(eq(snipeTargets.id, targetId))
-      .returning();
+      .returning({ id: snipeTargets.id });
 
     if (result.length === 0) {
       return NextResponse.json(
@@ -7,7 +7,7 @@
 
 import { type NextRequest, NextResponse } from "next/server";
 import { z } from "zod";
-import { UnifiedMexcServiceV2 } from "@/src/services/api/unified-mexc-service-v2";
+import { getUnifiedMexcServiceV2 } from "@/src/services/api/unified-mexc-service-v2";
 import { mexcApiBreaker } from "@/src/services/risk/circuit-breaker";
 import { CircuitBreakerSafetyService } from "@/src/services/risk/circuit-breaker-safety-service";
 
@@ -46,7 +46,7 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
     const validatedRequest = FixRequestSchema.parse(body);
 
     // Initialize services
-    const mexcService = new UnifiedMexcServiceV2();
+    const mexcService = getUnifiedMexcServiceV2();
     const safetyService = new CircuitBreakerSafetyService(mexcService);
     const reliabilityManager = mexcApiBreaker;
 
@@ -156,7 +156,7 @@ export async function POST(request: NextRequest): Promise<NextResponse> {
  */
 export async function GET(): Promise<NextResponse> {
   try {
-    const mexcService = new UnifiedMexcServiceV2();
+    const mexcService = getUnifiedMexcServiceV2();
     const safetyService = new CircuitBreakerSafetyService(mexcService);
 
     // Get current status without making changes
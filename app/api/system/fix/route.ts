@@ -16,7 +16,6 @@ import {
   createSuccessResponse,
 } from "@/src/lib/api-response";
 import { MexcConfigValidator } from "@/src/services/api/mexc-config-validator";
-import { UnifiedMexcServiceV2 } from "@/src/services/api/unified-mexc-service-v2";
 import { circuitBreakerRegistry } from "@/src/services/risk/circuit-breaker";
 import { getCoreTrading } from "@/src/services/trading/consolidated/core-trading/base-service";
 
@@ -49,7 +48,6 @@ export async function POST(_request: NextRequest) {
     const recommendations: string[] = [];
 
     // Initialize services
-    const _mexcService = new UnifiedMexcServiceV2();
     const patternEngine = PatternDetectionCore.getInstance();
     const configValidator = MexcConfigValidator.getInstance();
     const tradingService = getCoreTrading();
@@ -1,4 +1,3 @@
-import { eq } from "drizzle-orm";
 import type { NextRequest } from "next/server";
 import { db, getUserPreferences } from "@/src/db";
 import { userPreferences } from "@/src/db/schemas/auth";
@@ -9,6 +8,7 @@ import {
   HTTP_STATUS,
 } from "@/src/lib/api-response";
 import { handleApiError } from "@/src/lib/error-handler";
+import { patternToDatabaseBridge } from "@/src/services/data/pattern-detection/pattern-to-database-bridge";
 import { getCoreTrading } from "@/src/services/trading/consolidated/core-trading/base-service";
 
 const coreTrading = getCoreTrading();
@@ -363,17 +363,23 @@ function transformCoreConfigToPreferences(
 }
 
 /**
- * Update user preferences in database
+ * Update user preferences in database, creating the row with defaults for
+ * users who have not saved preferences yet (single statement either way)
  */
 async function updateUserPreferencesInDatabase(
   userId: string,
   updates: Partial<typeof userPreferences.$inferSelect>
 ): Promise<void> {
+  const changes = { ...updates, updatedAt: new Date() };
+
   await db
-    .update(userPreferences)
-    .set({
-      ...updates,
-      updatedAt: new Date(),
-    })
-    .where(eq(userPreferences.userId, userId));
+    .insert(userPreferences)
+    .values({ ...changes, userId })
+    .onConflictDoUpdate({
+      target: userPreferences.userId,
+      set: changes,
+    });
+
+  // The bridge caches preferences when creating snipe targets
+  patternToDatabaseBridge.invalidateUserPreferences(userId);
 }
@@ -1,5 +1,6 @@
 import { type NextRequest, NextResponse } from "next/server";
 import { inngest } from "@/src/inngest/client";
+import { currentTimestamp } from "@/src/lib/api-response";
 
 export async function POST(_request: NextRequest) {
   try {
@@ -8,7 +9,7 @@ export async function POST(_request: NextRequest) {
       name: "mexc/calendar.poll",
       data: {
         triggeredBy: "ui",
-        timestamp: new Date().toISOString(),
+        timestamp: currentTimestamp(),
       },
     });
 
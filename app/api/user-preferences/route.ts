@@ -1,6 +1,13 @@
 import { eq } from "drizzle-orm";
 import type { NextRequest } from "next/server";
-import { db, type NewUserPreferences, userPreferences } from "@/src/db";
+import {
+  db,
+  type NewUserPreferences,
+  parsePreferenceJson,
+  parseReadyStatePattern,
+  userPreferences,
+} from "@/src/db";
+import type { UserTradingPreferences } from "@/src/hooks/use-user-preferences";
 import {
   apiResponse,
   createSuccessResponse,
@@ -12,6 +19,32 @@ import {
   withApiErrorHandling,
   withDatabaseErrorHandling,
 } from "@/src/lib/central-api-error-handler";
+import { patternToDatabaseBridge } from "@/src/services/data/pattern-detection/pattern-to-database-bridge";
+
+// POST body is a PATCH-style bag: every key is optional and only the keys
+// present are written. It is typed rather than run through a schema, with
+// the few constrained fields checked inline where they are mapped.
+type UserPreferencesPatch = Partial<UserTradingPreferences> & {
+  takeProfitLevel1?: number;
+  takeProfitLevel2?: number;
+  takeProfitLevel3?: number;
+  takeProfitLevel4?: number;
+  takeProfitCustom?: number;
+};
+
+// Safe JSON stringification helper
+function safeJsonStringify(obj: unknown): string | null {
+  if (obj === undefined || obj === null) return null;
+  try {
+    return JSON.stringify(obj);
+  } catch (error) {
+    console.warn("[API] Failed to stringify JSON object:", {
+      error: error instanceof Error ? error.message : "Unknown error",
+      objectType: typeof obj,
+    });
+    return null;
+  }
+}
 
 // GET /api/user-preferences?userId=xxx
 export const GET = withApiErrorHandling(async (request: NextRequest) => {
@@ -36,44 +69,7 @@ export const GET = withApiErrorHandling(async (request: NextRequest) => {
 
   const prefs = result[0];
 
-  // Safe pattern parsing with fallbacks
-  let patternParts: number[] = [2, 2, 4]; // Default fallback
-  try {
-    if (
-      prefs.readyStatePattern &&
-      typeof prefs.readyStatePattern === "string"
-    ) {
-      const parts = prefs.readyStatePattern.split(",").map(Number);
-      if (
-        parts.length >= 3 &&
-        parts.every((p: number) => !Number.isNaN(p) && p > 0)
-      ) {
-        patternParts = parts;
-      }
-    }
-  } catch (error) {
-    console.warn("[API] Failed to parse readyStatePattern, using defaults:", {
-      pattern: prefs.readyStatePattern,
-      error: error instanceof Error ? error.message : "Unknown error",
-    });
-  }
-
-  // Safe JSON parsing helper
-  const safeJsonParse = (
-    jsonString: string | null | undefined,
-    fallback: unknown = undefined
-  ) => {
-    if (!jsonString || typeof jsonString !== "string") return fallback;
-    try {
-      return JSON.parse(jsonString);
-    } catch (error) {
-      console.warn("[API] Failed to parse JSON field:", {
-        jsonString: jsonString.substring(0, 100),
-        error: error instanceof Error ? error.message : "Unknown error",
-      });
-      return fallback;
-    }
-  };
+  const patternParts = parseReadyStatePattern(prefs.readyStatePattern);
 
   const response = {
     userId: prefs.userId,
@@ -107,10 +103,10 @@ export const GET = withApiErrorHandling(async (request: NextRequest) => {
     symbolsPollIntervalSeconds: prefs.symbolsPollIntervalSeconds,
     // Enhanced Take Profit Strategy Settings
     takeProfitStrategy: prefs.takeProfitStrategy || "balanced",
-    takeProfitLevelsConfig: safeJsonParse(prefs.takeProfitLevelsConfig),
+    takeProfitLevelsConfig: parsePreferenceJson(prefs.takeProfitLevelsConfig),
     // Legacy Exit Strategy Settings (for backward compatibility)
     selectedExitStrategy: prefs.selectedExitStrategy || "balanced",
-    customExitStrategy: safeJsonParse(prefs.customExitStrategy),
+    customExitStrategy: parsePreferenceJson(prefs.customExitStrategy),
     autoBuyEnabled: prefs.autoBuyEnabled ?? true,
     autoSellEnabled: prefs.autoSellEnabled ?? true,
     autoSnipeEnabled: prefs.autoSnipeEnabled ?? true,
@@ -121,7 +117,7 @@ export const GET = withApiErrorHandling(async (request: NextRequest) => {
 
 // POST /api/user-preferences
 export const POST = withApiErrorHandling(async (request: NextRequest) => {
-  const body = await request.json();
+  const body = (await request.json()) as UserPreferencesPatch;
   const { userId, ...data } = body;
 
   const validatedUserId = validateUserId(userId);
@@ -241,20 +237,6 @@ export const POST = withApiErrorHandling(async (request: NextRequest) => {
     updateData.symbolsPollIntervalSeconds = data.symbolsPollIntervalSeconds;
   }
 
-  // Safe JSON stringification helper
-  const safeJsonStringify = (obj: unknown): string | null => {
-    if (obj === undefined || obj === null) return null;
-    try {
-      return JSON.stringify(obj);
-    } catch (error) {
-      console.warn("[API] Failed to stringify JSON object:", {
-        error: error instanceof Error ? error.message : "Unknown error",
-        objectType: typeof obj,
-      });
-      return null;
-    }
-  };
-
   // Enhanced Take Profit Strategy Settings
   if (data.takeProfitStrategy !== undefined) {
     updateData.takeProfitStrategy = data.takeProfitStrategy;
@@ -286,52 +268,52 @@ export const POST = withApiErrorHandling(async (request: NextRequest) => {
     updateData.autoSnipeEnabled = data.autoSnipeEnabled;
   }
 
-  // Try to update first
-  const result = (await withDatabaseErrorHandling(async () => {
-    return await db
-      .update(userPreferences)
-      .set(updateData)
-      .where(eq(userPreferences.userId, validatedUserId))
-      .returning();
-  }, "update user preferences")) as (typeof userPreferences.$inferSelect)[];
+  // Defaults used only when the user has no preferences row yet
+  const newPrefs: NewUserPreferences = {
+    userId: validatedUserId,
+    defaultBuyAmountUsdt: data.defaultBuyAmountUsdt || 100.0,
+    maxConcurrentSnipes: data.maxConcurrentSnipes || 3,
+    takeProfitLevel1:
+      data.takeProfitLevel1 || data.takeProfitLevels?.level1 || 5.0,
+    takeProfitLevel2:
+      data.takeProfitLevel2 || data.takeProfitLevels?.level2 || 10.0,
+    takeProfitLevel3:
+      data.takeProfitLevel3 || data.takeProfitLevels?.level3 || 15.0,
+    takeProfitLevel4:
+      data.takeProfitLevel4 || data.takeProfitLevels?.level4 || 25.0,
+    takeProfitCustom: data.takeProfitCustom || data.takeProfitLevels?.custom,
+    defaultTakeProfitLevel: data.defaultTakeProfitLevel || 2,
+    stopLossPercent: data.stopLossPercent || 5.0,
+    riskTolerance: data.riskTolerance || "medium",
+    readyStatePattern: data.readyStatePattern?.join(",") || "2,2,4",
+    targetAdvanceHours: data.targetAdvanceHours || 3.5,
+    calendarPollIntervalSeconds: data.calendarPollIntervalSeconds || 300,
+    symbolsPollIntervalSeconds: data.symbolsPollIntervalSeconds || 30,
+    // Exit Strategy Settings with defaults
+    selectedExitStrategy: data.selectedExitStrategy || "balanced",
+    // Already serialized into updateData above when provided
+    customExitStrategy: null,
+    autoBuyEnabled: data.autoBuyEnabled ?? true,
+    autoSellEnabled: data.autoSellEnabled ?? true,
+    autoSnipeEnabled: data.autoSnipeEnabled ?? true,
+    ...updateData,
+  };
 
-  if (result.length === 0) {
-    // If no rows were updated, create a new record
-    const newPrefs: NewUserPreferences = {
-      userId: validatedUserId,
-      defaultBuyAmountUsdt: data.defaultBuyAmountUsdt || 100.0,
-      maxConcurrentSnipes: data.maxConcurrentSnipes || 3,
-      takeProfitLevel1:
-        data.takeProfitLevel1 || data.takeProfitLevels?.level1 || 5.0,
-      takeProfitLevel2:
-        data.takeProfitLevel2 || data.takeProfitLevels?.level2 || 10.0,
-      takeProfitLevel3:
-        data.takeProfitLevel3 || data.takeProfitLevels?.level3 || 15.0,
-      takeProfitLevel4:
-        data.takeProfitLevel4 || data.takeProfitLevels?.level4 || 25.0,
-      takeProfitCustom: data.takeProfitCustom || data.takeProfitLevels?.custom,
-      defaultTakeProfitLevel: data.defaultTakeProfitLevel || 2,
-      stopLossPercent: data.stopLossPercent || 5.0,
-      riskTolerance: data.riskTolerance || "medium",
-      readyStatePattern: data.readyStatePattern?.join(",") || "2,2,4",
-      targetAdvanceHours: data.targetAdvanceHours || 3.5,
-      calendarPollIntervalSeconds: data.calendarPollIntervalSeconds || 300,
-      symbolsPollIntervalSeconds: data.symbolsPollIntervalSeconds || 30,
-      // Exit Strategy Settings with defaults
-      selectedExitStrategy: data.selectedExitStrategy || "balanced",
-      customExitStrategy: data.customExitStrategy
-        ? safeJsonStringify(data.customExitStrategy)
-        : null,
-      autoBuyEnabled: data.autoBuyEnabled ?? true,
-      autoSellEnabled: data.autoSellEnabled ?? true,
-      autoSnipeEnabled: data.autoSnipeEnabled ?? true,
-      ...updateData,
-    };
+  // Single round trip: insert defaults for new users, otherwise apply the
+  // update. The unique user_id constraint also closes the race where two
+  // concurrent first saves would both try to insert.
+  await withDatabaseErrorHandling(async () => {
+    return await db
+      .insert(userPreferences)
+      .values(newPrefs)
+      .onConflictDoUpdate({
+        target: userPreferences.userId,
+        set: updateData,
+      });
+  }, "upsert user preferences");
 
-    await withDatabaseErrorHandling(async () => {
-      return await db.insert(userPreferences).values(newPrefs);
-    }, "insert user preferences");
-  }
+  // The bridge caches preferences when creating snipe targets
+  patternToDatabaseBridge.invalidateUserPreferences(validatedUserId);
 
   return apiResponse(
     createSuccessResponse(data, {
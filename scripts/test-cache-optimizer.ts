@@ -15,7 +15,7 @@
  */
 
 import { execSync, spawn } from 'child_process';
-import { statSync, existsSync, readFileSync, writeFileSync, readdirSync } from 'fs';
+import { statSync, existsSync, readFileSync, writeFileSync, readdirSync, mkdirSync, rmSync } from 'fs';
 import { join, relative, extname } from 'path';
 import { createHash } from 'crypto';
 import { glob } from 'glob';
@@ -547,7 +547,7 @@ class TestCacheOptimizer {
    */
   private ensureCacheDir(): void {
     try {
-      execSync(`mkdir -p "${this.cacheDir}"`, { stdio: 'pipe' });
+      mkdirSync(this.cacheDir, { recursive: true });
     } catch {
       // Ignore if directory already exists or can't be created
     }
@@ -560,13 +560,17 @@ class TestCacheOptimizer {
     console.log('🧹 Clearing all test caches...');
     
     try {
-      // Clear Vitest cache
-      execSync('rm -rf node_modules/.vitest node_modules/.vite*', { stdio: 'pipe' });
+      // Clear Vitest cache (node_modules/.vitest and node_modules/.vite*)
+      if (existsSync('node_modules')) {
+        for (const entry of readdirSync('node_modules')) {
+          if (entry.startsWith('.vite')) {
+            rmSync(join('node_modules', entry), { recursive: true, force: true });
+          }
+        }
+      }
       
       // Clear test cache
-      if (existsSync(this.cacheFile)) {
-        execSync(`rm -f "${this.cacheFile}"`, { stdio: 'pipe' });
-      }
+      rmSync(this.cacheFile, { force: true });
       
       // Reset cache
       this.cache = this.createEmptyCache();
@@ -185,22 +185,18 @@ interface CalendarEntry {
 
 // Helper function to filter upcoming coins - show listings from today up to 30 days ahead
 function filterUpcomingCoins(calendarData: CalendarEntry[]): CalendarEntry[] {
+  const today = new Date();
+  today.setHours(0, 0, 0, 0); // Set to start of today (00:00:00)
+  const windowStart = today.getTime();
+  // Only show listings within next 30 days to keep it manageable
+  const windowEnd = windowStart + 30 * 24 * 60 * 60 * 1000;
+
   return calendarData.filter((item) => {
     try {
       if (!item.firstOpenTime || !item.vcoinId) return false;
-      const launchTime = new Date(item.firstOpenTime);
-      const today = new Date();
-      today.setHours(0, 0, 0, 0); // Set to start of today (00:00:00)
-
-      // Only show listings within next 30 days to keep it manageable
-      const maxFutureDate = new Date(
-        today.getTime() + 30 * 24 * 60 * 60 * 1000
-      );
+      const launchTime = new Date(item.firstOpenTime).getTime();
 
-      return (
-        launchTime.getTime() >= today.getTime() &&
-        launchTime.getTime() <= maxFutureDate.getTime()
-      );
+      return launchTime >= windowStart && launchTime <= windowEnd;
     } catch {
       return false;
     }
@@ -280,13 +276,15 @@ function limitDisplayedListings(
   listings: CalendarEntry[],
   maxCount = 50
 ): CalendarEntry[] {
+  // Convert each launch time once rather than twice per comparison
   return listings
-    .sort((a, b) => {
-      const timeA = a.firstOpenTime ? new Date(a.firstOpenTime).getTime() : 0;
-      const timeB = b.firstOpenTime ? new Date(b.firstOpenTime).getTime() : 0;
-      return timeA - timeB;
-    })
-    .slice(0, maxCount);
+    .map((item) => ({
+      item,
+      time: item.firstOpenTime ? new Date(item.firstOpenTime).getTime() : 0,
+    }))
+    .sort((a, b) => a.time - b.time)
+    .slice(0, maxCount)
+    .map(({ item }) => item);
 }
 
 // Hook to handle data processing logic
@@ -75,20 +75,23 @@ export function UpcomingCoinsSection() {
       }
     });
 
-    // Sort by earliest launch time (ascending)
-    const sortByLaunchTime = (
-      a: UpcomingCalendarEntry,
-      b: UpcomingCalendarEntry
-    ) => {
-      const timeA = a.firstOpenTime ? new Date(a.firstOpenTime).getTime() : 0;
-      const timeB = b.firstOpenTime ? new Date(b.firstOpenTime).getTime() : 0;
-      return timeA - timeB;
-    };
-
-    today.sort(sortByLaunchTime);
-    tomorrow.sort(sortByLaunchTime);
+    // Sort by earliest launch time (ascending), converting each launch time
+    // once rather than twice per comparison
+    const sortByLaunchTime = (entries: UpcomingCalendarEntry[]) =>
+      entries
+        .map((entry) => ({
+          entry,
+          time: entry.firstOpenTime
+            ? new Date(entry.firstOpenTime).getTime()
+            : 0,
+        }))
+        .sort((a, b) => a.time - b.time)
+        .map(({ entry }) => entry);
 
-    return { today, tomorrow };
+    return {
+      today: sortByLaunchTime(today),
+      tomorrow: sortByLaunchTime(tomorrow),
+    };
   }, [allCalendarData]);
 
   const formatLaunchTime = (firstOpenTime: string | number) => {
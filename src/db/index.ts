@@ -36,6 +36,7 @@ interface ConnectionPoolConfig {
 
 // Client cache for connection pooling
 let postgresClient: ReturnType<typeof postgres> | null = null;
+let readerClient: ReturnType<typeof postgres> | null = null;
 
 // Sleep utility for retry logic
 const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
@@ -109,10 +110,17 @@ const _hasSQLiteConfig = () => {
   );
 };
 
+// Last DATABASE_URL that passed validation, so it is only parsed once
+let validatedDatabaseUrl: string | null = null;
+
 // Get the appropriate database URL with validation
 const getDatabaseUrl = () => {
   const url = process.env.DATABASE_URL;
 
+  if (url && url === validatedDatabaseUrl) {
+    return url;
+  }
+
   if (!url) {
     const isTest = process.env.NODE_ENV === "test" || process.env.VITEST;
     if (isTest) {
@@ -130,6 +138,7 @@ const getDatabaseUrl = () => {
     if (!["postgresql:", "postgres:", "sqlite:"].includes(parsed.protocol)) {
       throw new Error(`Unsupported database protocol: ${parsed.protocol}`);
     }
+    validatedDatabaseUrl = url;
     return url;
   } catch (error) {
     if (error instanceof TypeError) {
@@ -149,8 +158,27 @@ const _isBuildTime = () => {
   return detectBuildProcess() || isStaticGeneration();
 };
 
+// Read a positive integer pool setting from the environment
+const readPoolSetting = (name: string, fallback: number): number => {
+  const value = Number.parseInt(process.env[name] || "", 10);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+};
+
+// Optional read replica; read-only queries fall back to the primary without it
+const getReadDatabaseUrl = () => {
+  const url = process.env.DATABASE_READ_URL;
+  return url?.startsWith("postgresql://") || url?.startsWith("postgres://")
+    ? url
+    : null;
+};
+
 // Create PostgreSQL client with connection pooling and validation
 function createPostgresClient() {
+  // Return cached client if available
+  if (postgresClient) {
+    return postgresClient;
+  }
+
   const databaseUrl = getDatabaseUrl();
 
   if (
@@ -162,22 +190,43 @@ function createPostgresClient() {
     );
   }
 
-  // Return cached client if available
-  if (postgresClient) {
-    return postgresClient;
+  postgresClient = openPostgresClient(databaseUrl, "primary");
+  return postgresClient;
+}
+
+// Create the read replica client, sharing the primary's pool settings
+function createReaderClient(readUrl: string) {
+  if (!readerClient) {
+    readerClient = openPostgresClient(readUrl, "read replica");
   }
+  return readerClient;
+}
 
+function openPostgresClient(databaseUrl: string, role: string) {
   const isProduction =
     process.env.NODE_ENV === "production" || process.env.VERCEL;
   const isTest = process.env.NODE_ENV === "test" || process.env.VITEST;
   const isSupabase = hasSupabaseConfig();
+  // PgBouncer in transaction mode (Supabase's pooler on 6543) hands each
+  // transaction a different backend, so server-side prepared statements
+  // can't be reused across queries there
+  const usesTransactionPooler =
+    databaseUrl.includes(":6543/") || databaseUrl.includes("pgbouncer=true");
+
+  // Serverless instances each hold their own small pool. A long-running
+  // server also executes Inngest steps concurrently, so give it enough
+  // connections that steps don't queue behind each other for a client.
+  const defaultPoolSize = process.env.VERCEL ? 10 : isProduction ? 20 : 8;
 
   // PostgreSQL connection configuration
   const connectionConfig = {
-    // Connection pool settings - optimized for Supabase
-    max: isProduction ? 10 : 8,
-    idle_timeout: 20, // Supabase can handle longer timeouts
-    connect_timeout: 10,
+    // Connection pool settings - optimized for Supabase, tunable per deployment
+    max: readPoolSetting("DATABASE_POOL_SIZE", defaultPoolSize),
+    // Supabase can handle longer timeouts
+    idle_timeout: readPoolSetting("DATABASE_IDLE_TIMEOUT_SECONDS", 20),
+    connect_timeout: readPoolSetting("DATABASE_CONNECT_TIMEOUT_SECONDS", 10),
+    // Recycle long-lived connections so warm workers don't hold stale sockets
+    max_lifetime: readPoolSetting("DATABASE_MAX_LIFETIME_SECONDS", 1800),
 
     // Keep alive settings
     keep_alive: 120, // Supabase benefits from longer keepalive
@@ -185,8 +234,9 @@ function createPostgresClient() {
     // SSL/TLS settings
     ssl: isProduction ? "require" : ("prefer" as any),
 
-    // Performance optimizations
-    prepare: !isTest, // Disable prepared statements for Supabase initially
+    // Performance optimizations: reuse prepared statements for repeated
+    // queries on direct connections
+    prepare: !isTest && !usesTransactionPooler,
 
     // Connection handling
     connection: {
@@ -215,11 +265,11 @@ function createPostgresClient() {
   };
 
   try {
-    postgresClient = postgres(databaseUrl, connectionConfig);
+    const client = postgres(databaseUrl, connectionConfig);
     getLogger().info(
-      `[Database] PostgreSQL connection established${isSupabase ? " with Supabase" : ""}`
+      `[Database] PostgreSQL ${role} connection established${isSupabase ? " with Supabase" : ""}`
     );
-    return postgresClient;
+    return client;
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     getLogger().error(
@@ -635,11 +685,60 @@ export function getDb() {
   return dbInstance;
 }
 
+// Read-only database handle. Routed to DATABASE_READ_URL when a replica is
+// configured, so read-heavy polling doesn't compete with writes on the
+// primary's pool. Replicas can lag, so only use it where slightly stale data
+// is acceptable: never for reads that follow a write, such as preferences
+// fetched straight after being saved.
+let readDbInstance: ReturnType<typeof createDatabase> | null = null;
+
+export function getReadDb() {
+  const readUrl = getReadDatabaseUrl();
+  const primary = getDb();
+  // Mock, SQLite and build-safe databases have no replica
+  if (
+    !readUrl ||
+    _isBuildTime() ||
+    (primary as any).$isMock ||
+    (primary as any).$isSQLite
+  ) {
+    return primary;
+  }
+  if (!readDbInstance) {
+    try {
+      const baseDb = drizzle(createReaderClient(readUrl), {
+        schema: supabaseSchema,
+      });
+      readDbInstance = instrumentDatabase(baseDb) as ReturnType<
+        typeof createDatabase
+      >;
+    } catch (error) {
+      getLogger().warn(
+        "[Database] Read replica unavailable, using primary:",
+        error
+      );
+      return primary;
+    }
+  }
+  return readDbInstance;
+}
+
 // Clear cached database instance (for testing)
 export function clearDbCache() {
   // Safely clear cached instances without triggering URL access
   try {
     dbInstance = null;
+    readDbInstance = null;
+
+    // The read replica client is owned here, so close its pool rather than
+    // leaking open connections when the cache is reset
+    if (readerClient) {
+      const reader = readerClient;
+      readerClient = null;
+      reader.end({ timeout: 2 }).catch((error) => {
+        getLogger().debug("[Database] Read replica close failed:", error);
+      });
+    }
 
     // Only clear postgresClient if DATABASE_URL is properly configured
     if (process.env.DATABASE_URL && postgresClient) {
@@ -663,21 +762,48 @@ export function clearDbCache() {
   }
 }
 
+// Lazily resolved database handle. Every `db.select(...)` etc. goes through
+// this trap, so bound methods are cached per instance instead of calling
+// bind() on each access; a new instance (after clearDbCache) starts fresh.
+function createDatabaseProxy(
+  resolve: () => ReturnType<typeof createDatabase>
+): ReturnType<typeof createDatabase> {
+  const boundMethods = new WeakMap<
+    object,
+    Map<PropertyKey, { method: unknown; bound: unknown }>
+  >();
+
+  return new Proxy({} as ReturnType<typeof createDatabase>, {
+    get(_target, prop: keyof ReturnType<typeof createDatabase>) {
+      const instance = resolve();
+      const value = instance[prop];
+
+      // Bind methods to maintain correct context
+      if (typeof value !== "function") {
+        return value;
+      }
+
+      let methods = boundMethods.get(instance);
+      if (!methods) {
+        methods = new Map();
+        boundMethods.set(instance, methods);
+      }
+      // Rebind if the method itself was replaced (e.g. spied on in tests)
+      let cached = methods.get(prop);
+      if (!cached || cached.method !== value) {
+        cached = { method: value, bound: value.bind(instance) };
+        methods.set(prop, cached);
+      }
+      return cached.bound;
+    },
+  });
+}
+
 // Export a getter that ensures proper typing - FIXED: Eliminate circular dependency
-export const db = new Proxy({} as ReturnType<typeof createDatabase>, {
-  get(_target, prop: keyof ReturnType<typeof createDatabase>) {
-    // FIXED: Direct call to getDb() instead of recursive ensureDbInstance()
-    const instance = getDb();
-    const value = instance[prop];
-
-    // Bind methods to maintain correct context
-    if (typeof value === "function") {
-      return value.bind(instance);
-    }
+// FIXED: Direct call to getDb() instead of recursive ensureDbInstance()
+export const db = createDatabaseProxy(getDb);
 
-    return value;
-  },
-});
+export const readDb = createDatabaseProxy(getReadDb);
 
 // Export schemas for use in other files
 export * from "./schemas";
@@ -936,6 +1062,44 @@ export async function monitoredQuery<T>(
 }
 
 // User Preferences Database Operations
+const DEFAULT_READY_STATE_PATTERN = [2, 2, 4];
+
+/**
+ * Parse the comma-separated ready state pattern stored on user preferences,
+ * falling back to the default pattern for missing or malformed values.
+ */
+export function parseReadyStatePattern(
+  pattern: string | null | undefined
+): number[] {
+  if (!pattern || typeof pattern !== "string") {
+    return [...DEFAULT_READY_STATE_PATTERN];
+  }
+  const parts = pattern.split(",").map(Number);
+  return parts.length >= 3 && parts.every((p) => !Number.isNaN(p) && p > 0)
+    ? parts
+    : [...DEFAULT_READY_STATE_PATTERN];
+}
+
+/**
+ * Parse a JSON text column from user preferences, returning the fallback
+ * when the value is missing or malformed.
+ */
+export function parsePreferenceJson(
+  jsonString: string | null | undefined,
+  fallback: unknown = undefined
+) {
+  if (!jsonString || typeof jsonString !== "string") return fallback;
+  try {
+    return JSON.parse(jsonString);
+  } catch (error) {
+    getLogger().warn("Failed to parse JSON field:", {
+      jsonString: jsonString.substring(0, 100),
+      error: error instanceof Error ? error.message : "Unknown error",
+    });
+    return fallback;
+  }
+}
+
 export async function getUserPreferences(userId: string): Promise<any | null> {
   try {
     // Use Supabase userPreferences table
@@ -957,52 +1121,15 @@ export async function getUserPreferences(userId: string): Promise<any | null> {
 
     const prefs = result[0];
 
-    // Safe pattern parsing with fallbacks
-    let patternParts: number[] = [2, 2, 4]; // Default fallback
-    try {
-      if (
-        prefs.readyStatePattern &&
-        typeof prefs.readyStatePattern === "string"
-      ) {
-        const parts = prefs.readyStatePattern.split(",").map(Number);
-        if (
-          parts.length >= 3 &&
-          parts.every((p: number) => !Number.isNaN(p) && p > 0)
-        ) {
-          patternParts = parts;
-        }
-      }
-    } catch (error) {
-      getLogger().warn("Failed to parse readyStatePattern, using defaults:", {
-        pattern: prefs.readyStatePattern,
-        error: error instanceof Error ? error.message : "Unknown error",
-      });
-    }
-
-    // Safe JSON parsing helper
-    const safeJsonParse = (
-      jsonString: string | null | undefined,
-      fallback: any = undefined
-    ) => {
-      if (!jsonString || typeof jsonString !== "string") return fallback;
-      try {
-        return JSON.parse(jsonString);
-      } catch (error) {
-        getLogger().warn("Failed to parse JSON field:", {
-          jsonString: jsonString.substring(0, 100),
-          error: error instanceof Error ? error.message : "Unknown error",
-        });
-        return fallback;
-      }
-    };
-
     return {
       ...prefs,
       // Parse JSON fields safely
-      takeProfitLevelsConfig: safeJsonParse(prefs.takeProfitLevelsConfig),
-      customExitStrategy: safeJsonParse(prefs.customExitStrategy),
+      takeProfitLevelsConfig: parsePreferenceJson(
+        prefs.takeProfitLevelsConfig
+      ),
+      customExitStrategy: parsePreferenceJson(prefs.customExitStrategy),
       // Include parsed pattern for convenience
-      readyStatePatternParts: patternParts,
+      readyStatePatternParts: parseReadyStatePattern(prefs.readyStatePattern),
     };
   } catch (error) {
     getLogger().error("Failed to get user preferences:", { userId, error });
@@ -1137,9 +1264,20 @@ export async function closeDatabase() {
       }
     }
 
+    // Close the read replica connection if one was opened
+    if (readerClient) {
+      try {
+        await readerClient.end({ timeout: 2 });
+      } catch (error) {
+        getLogger().debug("[Database] Read replica close failed:", error);
+      }
+    }
+
     // Reset cached instances
     dbInstance = null;
+    readDbInstance = null;
     postgresClient = null;
+    readerClient = null;
   } catch (error) {
     if (!isTest) {
       getLogger().error("[Database] Error closing database:", error);
@@ -0,0 +1,4 @@
+-- Composite indexes matching the hot snipe target and execution history queries
+CREATE INDEX IF NOT EXISTS "snipe_targets_status_priority_created_idx" ON "snipe_targets" USING btree ("status","priority","created_at");
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "execution_history_user_created_idx" ON "execution_history" USING btree ("user_id","created_at" DESC NULLS LAST);
@@ -62,6 +62,12 @@ export const snipeTargets = pgTable(
       table.status.asc().nullsLast(),
       table.targetExecutionTime.asc().nullsLast()
     ),
+    index("snipe_targets_status_priority_created_idx").using(
+      "btree",
+      table.status.asc().nullsLast(),
+      table.priority.asc().nullsLast(),
+      table.createdAt.asc().nullsLast()
+    ),
   ]
 );
 
@@ -142,6 +148,11 @@ export const executionHistory = pgTable(
       table.userId.asc().nullsLast(),
       table.executionTime.desc().nullsLast()
     ),
+    index("execution_history_user_created_idx").using(
+      "btree",
+      table.userId.asc().nullsLast(),
+      table.createdAt.desc().nullsLast()
+    ),
   ]
 );
 
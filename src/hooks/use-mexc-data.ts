@@ -295,26 +295,31 @@ export function useMexcPatternDetection(vcoinId?: string) {
   };
 }
 
+// Select calendar entries launching within the next `windowMs`.
+// The window bounds are computed once and launch times compared as epoch
+// milliseconds, rather than allocating two Dates per entry on every render.
+function filterLaunchesWithin(
+  calendar: CalendarEntry[],
+  windowMs: number
+): CalendarEntry[] {
+  const now = Date.now();
+  const windowEnd = now + windowMs;
+
+  return calendar.filter((entry) => {
+    const launchTime =
+      typeof entry.firstOpenTime === "number"
+        ? entry.firstOpenTime
+        : new Date(entry.firstOpenTime).getTime();
+    return launchTime > now && launchTime < windowEnd;
+  });
+}
+
 // Hook for upcoming launches (next 24 hours)
 export function useUpcomingLaunches() {
   const { data: calendar, ...rest } = useMexcCalendar();
 
   const upcomingLaunches = Array.isArray(calendar)
-    ? calendar.filter((entry: CalendarEntry) => {
-        try {
-          const launchTime = new Date(entry.firstOpenTime);
-          const now = new Date();
-          const hours24 = 24 * 60 * 60 * 1000;
-
-          return (
-            launchTime.getTime() > now.getTime() &&
-            launchTime.getTime() < now.getTime() + hours24
-          );
-        } catch (_error) {
-          console.warn("Invalid date in calendar entry:", entry.firstOpenTime);
-          return false;
-        }
-      })
+    ? filterLaunchesWithin(calendar, 24 * 60 * 60 * 1000)
     : [];
 
   return {
@@ -329,21 +334,7 @@ export function useReadyLaunches() {
   const { data: calendar, ...rest } = useMexcCalendar();
 
   const readyLaunches = Array.isArray(calendar)
-    ? calendar.filter((entry: CalendarEntry) => {
-        try {
-          const launchTime = new Date(entry.firstOpenTime);
-          const now = new Date();
-          const hours4 = 4 * 60 * 60 * 1000;
-
-          return (
-            launchTime.getTime() > now.getTime() &&
-            launchTime.getTime() < now.getTime() + hours4
-          );
-        } catch (_error) {
-          console.warn("Invalid date in calendar entry:", entry.firstOpenTime);
-          return false;
-        }
-      })
+    ? filterLaunchesWithin(calendar, 4 * 60 * 60 * 1000)
     : [];
 
   return {
@@ -237,10 +237,19 @@ export const usePatternSniper = () => {
 
     let newReadyCount = 0;
 
+    // Index the pending symbols that are ready once, instead of scanning the
+    // full symbol list for every pending vcoin
+    const readySymbols = new Map<string, SymbolV2Entry>();
+    for (const s of symbols as SymbolV2Entry[]) {
+      if (pendingDetection.has(s.cd) && isValidForSnipe(s)) {
+        readySymbols.set(s.cd, s);
+      }
+    }
+
     for (const vcoinId of Array.from(pendingDetection)) {
-      const symbol = symbols.find((s: SymbolV2Entry) => s.cd === vcoinId);
+      const symbol = readySymbols.get(vcoinId);
 
-      if (symbol && isValidForSnipe(symbol)) {
+      if (symbol) {
         const calendar = calendarTargets.get(vcoinId);
         if (calendar && symbol.ca) {
           const target = processReadyToken(vcoinId, symbol, calendar);
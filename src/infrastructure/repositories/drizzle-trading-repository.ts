@@ -36,7 +36,7 @@ export class DrizzleTradingRepository implements TradingRepository {
       const [insertedTrade] = await db
         .insert(snipeTargets)
         .values(tradeData)
-        .returning();
+        .returning({ id: snipeTargets.id });
 
       // Also insert into transactions table for tracking
       if (trade.hasOrders()) {
@@ -121,6 +121,28 @@ function isSyncResult(value: unknown): value is SyncResult {
   );
 }
 
+// Shared orchestrator: constructing one builds every agent (each with its own
+// cache cleanup timer), so reuse a single instance across function runs.
+let orchestratorInstance: MexcOrchestrator | null = null;
+
+function getOrchestrator(): MexcOrchestrator {
+  if (!orchestratorInstance) {
+    orchestratorInstance = new MexcOrchestrator();
+  }
+  return orchestratorInstance;
+}
+
+// Deterministic id for a symbol watch event. Inngest drops events whose id it
+// has already seen (24h window), so a retried send or a listing rediscovered
+// by the next poll can't start a second watch chain for the same launch.
+function symbolWatchEventId(
+  vcoinId: string,
+  launchTime: string | undefined,
+  attempt: number
+): string {
+  return `mexc-symbol-watch-${vcoinId}-${launchTime ?? "unscheduled"}-${attempt}`;
+}
+
 // Helper function to update workflow status
 async function updateWorkflowStatus(action: string, data: unknown) {
   try {
@@ -229,7 +251,7 @@ export const pollMexcCalendar = inngest.createFunction(
           );
         }
 
-        const orchestrator = new MexcOrchestrator();
+        const orchestrator = getOrchestrator();
         return await orchestrator.executeCalendarDiscoveryWorkflow({
           trigger,
           force,
@@ -257,22 +279,23 @@ export const pollMexcCalendar = inngest.createFunction(
       ? discoveryResult.data
       : null;
 
-    // Update metrics with sync and discovery results
-    await updateWorkflowStatus("updateMetrics", {
-      metrics: {
-        readyTokens: discoveryData?.readyTargets?.length || 0,
-        synced: {
-          processed: syncResult.processed,
-          created: syncResult.created,
-          updated: syncResult.updated,
-        },
-      },
-    });
-
-    // Step 2: Process and send follow-up events for new listings
+    // Step 3: Record metrics and send follow-up events for new listings.
+    // Kept in one step so the status updates run once rather than on every
+    // replay of the function body
     const followUpEvents = await step.run(
       "process-discovery-results",
       async () => {
+        await updateWorkflowStatus("updateMetrics", {
+          metrics: {
+            readyTokens: discoveryData?.readyTargets?.length || 0,
+            synced: {
+              processed: syncResult.processed,
+              created: syncResult.created,
+              updated: syncResult.updated,
+            },
+          },
+        });
+
         if (discoveryData?.newListings?.length) {
           // Send symbol watch events for new discoveries
           const events = discoveryData.newListings.map(
@@ -282,6 +305,7 @@ export const pollMexcCalendar = inngest.createFunction(
               projectName?: string;
               launchTime?: string;
             }) => ({
+              id: symbolWatchEventId(listing.vcoinId, listing.launchTime, 1),
               name: "mexc/symbol.watch",
               data: {
                 vcoinId: listing.vcoinId,
@@ -293,9 +317,19 @@ export const pollMexcCalendar = inngest.createFunction(
             })
           );
 
-          // Send events
-          for (const eventData of events) {
-            await inngest.send(eventData);
+          // Send all events in one request; fall back to individual sends
+          // only if the batch is rejected. Event ids make the fallback safe
+          // if part of the batch was already accepted.
+          try {
+            await inngest.send(events);
+          } catch (error) {
+            logger.warn("Batch event send failed, sending individually:", {
+              count: events.length,
+              error: error instanceof Error ? error.message : String(error),
+            });
+            for (const eventData of events) {
+              await inngest.send(eventData);
+            }
           }
 
           await updateWorkflowStatus("addActivity", {
@@ -406,7 +440,7 @@ export const watchMexcSymbol = inngest.createFunction(
     const analysisResult = await step.run(
       "symbol-analysis-workflow",
       async () => {
-        const orchestrator = new MexcOrchestrator();
+        const orchestrator = getOrchestrator();
         return await orchestrator.executeSymbolAnalysisWorkflow({
           vcoinId,
           symbolName,
@@ -438,6 +472,7 @@ export const watchMexcSymbol = inngest.createFunction(
       if (symbolReady && hasCompleteData) {
         // Create trading strategy and target
         await inngest.send({
+          id: `mexc-strategy-create-${vcoinId}-${launchTime ?? "unscheduled"}`,
           name: "mexc/strategy.create",
           data: {
             vcoinId,
@@ -458,6 +493,7 @@ export const watchMexcSymbol = inngest.createFunction(
       if (attempt < 10) {
         // Schedule recheck
         await inngest.send({
+          id: symbolWatchEventId(vcoinId, launchTime, attempt + 1),
           name: "mexc/symbol.watch",
           data: {
             vcoinId,
@@ -530,7 +566,7 @@ export const analyzeMexcPatterns = inngest.createFunction(
     const patternResult = await step.run(
       "pattern-analysis-workflow",
       async () => {
-        const orchestrator = new MexcOrchestrator();
+        const orchestrator = getOrchestrator();
         return await orchestrator.executePatternAnalysisWorkflow({
           vcoinId,
           symbols,
@@ -620,7 +656,7 @@ export const createMexcTradingStrategy = inngest.createFunction(
     const strategyResult = await step.run(
       "trading-strategy-workflow",
       async () => {
-        const orchestrator = new MexcOrchestrator();
+        const orchestrator = getOrchestrator();
         return await orchestrator.executeTradingStrategyWorkflow({
           vcoinId,
           symbolData,
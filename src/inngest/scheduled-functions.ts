@@ -330,26 +330,27 @@ export const scheduledIntensiveAnalysis = inngest.createFunction(
     const _pipelineResult = await step.run(
       "comprehensive-pipeline",
       async () => {
-        // Trigger calendar discovery
-        await inngest.send({
-          name: "mexc/calendar.poll",
-          data: {
-            trigger: "intensive_scheduled",
-            force: true,
-            timestamp: new Date().toISOString(),
+        // Trigger calendar discovery and pattern analysis in one request
+        const timestamp = new Date().toISOString();
+        await inngest.send([
+          {
+            name: "mexc/calendar.poll",
+            data: {
+              trigger: "intensive_scheduled",
+              force: true,
+              timestamp,
+            },
           },
-        });
-
-        // Trigger pattern analysis
-        await inngest.send({
-          name: "mexc/patterns.analyze",
-          data: {
-            symbols: [],
-            analysisType: "discovery",
-            trigger: "intensive_scheduled",
-            timestamp: new Date().toISOString(),
+          {
+            name: "mexc/patterns.analyze",
+            data: {
+              symbols: [],
+              analysisType: "discovery",
+              trigger: "intensive_scheduled",
+              timestamp,
+            },
           },
-        });
+        ]);
 
         return { triggered: true };
       }
@@ -464,6 +464,27 @@ export async function getUserIdFromBody(request: NextRequest): Promise<string> {
   }
 }
 
+// Parsed comma-separated env allowlists, reparsed only when the raw value
+// changes so admin checks don't split and trim the list on every request
+const envAllowlists = new Map<string, { raw: string; values: Set<string> }>();
+
+function getEnvAllowlist(name: string): Set<string> {
+  const raw = process.env[name] || "";
+  const cached = envAllowlists.get(name);
+  if (cached && cached.raw === raw) {
+    return cached.values;
+  }
+
+  const values = new Set(
+    raw
+      .split(",")
+      .map((value) => value.trim())
+      .filter(Boolean)
+  );
+  envAllowlists.set(name, { raw, values });
+  return values;
+}
+
 /**
  * Check if user has admin role
  */
@@ -472,16 +493,12 @@ export async function checkAdminRole(user: any): Promise<boolean> {
     // Multi-level admin role check for comprehensive security
 
     // 1. Check environment-based admin list
-    const adminEmails =
-      process.env.ADMIN_EMAILS?.split(",").map((email) => email.trim()) || [];
-    if (adminEmails.includes(user.email)) {
+    if (getEnvAllowlist("ADMIN_EMAILS").has(user.email)) {
       return true;
     }
 
     // 2. Check admin user IDs from environment
-    const adminUserIds =
-      process.env.ADMIN_USER_IDS?.split(",").map((id) => id.trim()) || [];
-    if (adminUserIds.includes(user.id)) {
+    if (getEnvAllowlist("ADMIN_USER_IDS").has(user.id)) {
       return true;
     }
 
@@ -150,8 +150,10 @@ class GlobalApiResponseCache {
     parameters: Record<string, any>,
     options: CacheGetOptions | CacheSetOptions = {}
   ): string {
-    const paramStr =
-      Object.keys(parameters).length > 0 ? JSON.stringify(parameters) : "";
+    // Serialize once and treat an empty object as no parameters, rather
+    // than allocating a key list just to check for emptiness
+    const serialized = JSON.stringify(parameters);
+    const paramStr = serialized === "{}" ? "" : serialized;
     const method = options.method || "GET";
     return `${method}:${endpoint}:${paramStr}`;
   }
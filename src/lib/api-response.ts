@@ -96,6 +96,19 @@ function getLogger(): {
   return _logger;
 }
 
+// Response timestamps only need coarse resolution; reuse the ISO string for
+// a short window instead of formatting a new Date on every response.
+const TIMESTAMP_REUSE_MS = 200;
+let cachedTimestamp = { at: 0, iso: "" };
+
+export function currentTimestamp(): string {
+  const now = Date.now();
+  if (now - cachedTimestamp.at >= TIMESTAMP_REUSE_MS) {
+    cachedTimestamp = { at: now, iso: new Date(now).toISOString() };
+  }
+  return cachedTimestamp.iso;
+}
+
 export function createSuccessResponse<T>(
   data: T,
   meta?: ApiResponse<T>["meta"]
@@ -104,7 +117,7 @@ export function createSuccessResponse<T>(
     success: true,
     data,
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       ...meta,
     },
   };
@@ -121,7 +134,7 @@ export function createErrorResponse(
     success: false,
     error,
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       ...meta,
     },
   };
@@ -323,7 +336,7 @@ export function createHealthResponse(
     message: result.message,
     data: additionalData,
     meta: {
-      timestamp: result.timestamp || new Date().toISOString(),
+      timestamp: result.timestamp || currentTimestamp(),
       version: result.version || "1.0.0",
       environment: process.env.NODE_ENV || "development",
       ...result.details,
@@ -425,7 +438,7 @@ export function createCredentialResponse(
     },
     error: result.error,
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       credentialSource: result.credentialSource,
     },
   };
@@ -455,9 +468,9 @@ export function createServiceStatusResponse(
     message: `${result.serviceName} is ${result.status}`,
     data: result,
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       serviceName: result.serviceName,
-      lastChecked: result.lastChecked || new Date().toISOString(),
+      lastChecked: result.lastChecked || currentTimestamp(),
     },
   };
 }
@@ -499,7 +512,7 @@ export function createConfigResponse(
       warnings: result.warnings,
     },
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       configSource: result.configSource,
       totalMissing: result.missingVars?.length || 0,
       totalInvalid: result.invalidVars?.length || 0,
@@ -542,7 +555,7 @@ export function createSystemOverviewResponse(
         : `System has ${result.summary?.unhealthy || 0} critical issues`,
     data: result,
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       componentCount: Object.keys(result.components).length,
       ...result.summary,
     },
@@ -579,7 +592,7 @@ export function createOperationResponse<T>(
       warnings: result.warnings,
     },
     meta: {
-      timestamp: new Date().toISOString(),
+      timestamp: currentTimestamp(),
       operation: result.operation,
     },
   };
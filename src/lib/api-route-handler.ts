@@ -286,22 +286,30 @@ export function createApiRouteHandler<
 
       const requestDuration = Date.now() - startTime;
 
-      logger.performance("api_request_complete", startTime, {
+      // Serialize the response once and reuse it for the size metric, rather
+      // than stringifying the result a second time just to measure it
+      const body = JSON.stringify(
+        createSuccessResponse(result, {
+          requestId,
+          requestDuration: `${requestDuration}ms`,
+          timestamp: new Date().toISOString(),
+        })
+      );
+
+      logger.performance("api_request_complete", requestDuration, {
         requestId,
         routeName,
         operation: "request_complete",
-        responseSize: JSON.stringify(result).length,
+        responseSize: body.length,
         success: true,
       });
 
       // Return successful response
-      return apiResponse(
-        createSuccessResponse(result, {
-          requestId,
-          requestDuration: `${requestDuration}ms`,
-          timestamp: new Date().toISOString(),
-        })
-      );
+      const { NextResponse } = require("next/server");
+      return new NextResponse(body, {
+        status: HTTP_STATUS.OK,
+        headers: { "Content-Type": "application/json" },
+      });
     } catch (error) {
       const requestDuration = Date.now() - startTime;
       const safeError =
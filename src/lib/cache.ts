@@ -154,8 +154,11 @@ export const globalCacheManager = new CacheManager();
 export function generateCacheKey(
   ...components: (string | number | undefined)[]
 ): string {
-  return components
-    .filter((component) => component !== undefined && component !== null)
-    .map((component) => String(component))
-    .join(":");
+  // Built in one pass; this runs for every cached request
+  let key: string | undefined;
+  for (const component of components) {
+    if (component === undefined || component === null) continue;
+    key = key === undefined ? String(component) : `${key}:${component}`;
+  }
+  return key ?? "";
 }
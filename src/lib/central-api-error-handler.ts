@@ -66,14 +66,21 @@ export class ValidationError extends Error {
 }
 
 // Missing functions for compatibility
+// logLabel is logged before responding; respond lets a route keep its own
+// error body (e.g. api-response's handleApiError) instead of this module's
 export function withApiErrorHandling<T extends any[], R>(
-  handler: (...args: T) => Promise<R>
-): (...args: T) => Promise<R | NextResponse> {
-  return async (...args: T): Promise<R | NextResponse> => {
+  handler: (...args: T) => Promise<R>,
+  logLabel?: string,
+  respond: (error: unknown) => Response = handleApiError
+): (...args: T) => Promise<R | Response> {
+  return async (...args: T): Promise<R | Response> => {
     try {
       return await handler(...args);
     } catch (error) {
-      return handleApiError(error);
+      if (logLabel) {
+        console.error(`${logLabel}:`, { error: error });
+      }
+      return respond(error);
     }
   };
 }
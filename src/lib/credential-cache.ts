@@ -32,12 +32,18 @@ export async function getCachedCredentials(
 
   const encryptionService = getEncryptionService();
 
+  const [apiKey, secretKey, passphrase] = await Promise.all([
+    encryptionService.decryptAsync(encryptedApiKey),
+    encryptionService.decryptAsync(encryptedSecretKey),
+    encryptedPassphrase
+      ? encryptionService.decryptAsync(encryptedPassphrase)
+      : undefined,
+  ]);
+
   const credentials: CachedCredentials = {
-    apiKey: encryptionService.decrypt(encryptedApiKey),
-    secretKey: encryptionService.decrypt(encryptedSecretKey),
-    ...(encryptedPassphrase && {
-      passphrase: encryptionService.decrypt(encryptedPassphrase),
-    }),
+    apiKey,
+    secretKey,
+    ...(passphrase && { passphrase }),
   };
 
   cache.set(cacheKey, {
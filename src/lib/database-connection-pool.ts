@@ -209,20 +209,27 @@ export class DatabaseConnectionPool {
    * Invalidate cache entries matching patterns
    */
   private invalidateCache(patterns: string[]): void {
-    const keysToDelete: string[] = [];
-    const keys = Array.from(this.cache.keys());
-
-    for (const key of keys) {
-      for (const pattern of patterns) {
-        if (key.includes(pattern) || key.match(pattern)) {
-          keysToDelete.push(key);
-          break;
-        }
+    // Compile each pattern once up front; String#match would build a fresh
+    // RegExp for every key it is tested against
+    const matchers = patterns.map((pattern) => {
+      let regex: RegExp | null = null;
+      try {
+        regex = new RegExp(pattern);
+      } catch {
+        // Not a valid regex, fall back to substring matching only
       }
-    }
+      return { pattern, regex };
+    });
 
-    for (const key of keysToDelete) {
-      this.cache.delete(key);
+    // Deleting the current key while iterating a Map is safe, so walk the
+    // keys once without snapshotting them
+    for (const key of this.cache.keys()) {
+      const matches = matchers.some(
+        ({ pattern, regex }) => key.includes(pattern) || regex?.test(key)
+      );
+      if (matches) {
+        this.cache.delete(key);
+      }
     }
   }
 
@@ -310,15 +310,18 @@ export class EnhancedUnifiedCacheSystem extends UnifiedCacheSystem {
       // Track in analytics
       this.updateCategoryStats(category, "set", duration);
 
-      // Emit event
-      this.emitEvent({
-        key,
-        category,
-        action: "set",
-        timestamp: Date.now(),
-        size: originalSize || JSON.stringify(value).length,
-        duration,
-      });
+      // Emit event. Sizing an uncompressed value means a full JSON.stringify,
+      // so skip the event entirely when nobody is listening for sets.
+      if (this.eventCallbacks.get("set")?.length) {
+        this.emitEvent({
+          key,
+          category,
+          action: "set",
+          timestamp: Date.now(),
+          size: originalSize || JSON.stringify(value).length,
+          duration,
+        });
+      }
 
       // Performance monitoring
       if (this.performanceMonitoring) {
@@ -13,6 +13,7 @@ export interface InitializationResult {
 class StartupInitializer {
   private initialized = false;
   private modules: string[] = [];
+  private initializing: Promise<InitializationResult> | null = null;
 
   async initialize(): Promise<InitializationResult> {
     if (this.initialized) {
@@ -23,11 +24,23 @@ class StartupInitializer {
       };
     }
 
+    // Concurrent callers share the in-flight initialization
+    if (!this.initializing) {
+      this.initializing = this.runInitialization().finally(() => {
+        this.initializing = null;
+      });
+    }
+    return this.initializing;
+  }
+
+  private async runInitialization(): Promise<InitializationResult> {
     try {
-      // Initialize core modules
-      await this.initializeDatabase();
-      await this.initializeServices();
-      await this.initializeMiddleware();
+      // Initialize core modules concurrently; they have no ordering dependency
+      await Promise.all([
+        this.initializeDatabase(),
+        this.initializeServices(),
+        this.initializeMiddleware(),
+      ]);
 
       this.initialized = true;
 
@@ -73,6 +86,7 @@ class StartupInitializer {
 
   reset(): void {
     this.initialized = false;
+    this.initializing = null;
     this.modules = [];
   }
 }
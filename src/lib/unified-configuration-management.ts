@@ -362,6 +362,10 @@ export class ConfigurationManager {
   private listeners: Map<string, ((config: Configuration) => void)[]> =
     new Map();
   private watchMode = false;
+  // Derived views of the current config, rebuilt lazily after updateConfig
+  private validationResult: { valid: boolean; errors: string[] } | null =
+    null;
+  private summary: Record<string, any> | null = null;
 
   private constructor() {
     this.config = this.loadConfiguration();
@@ -419,6 +423,8 @@ export class ConfigurationManager {
     const validated = ConfigurationSchema.parse(merged);
 
     this.config = validated;
+    this.validationResult = null;
+    this.summary = null;
     this.notifyListeners();
   }
 
@@ -446,6 +452,13 @@ export class ConfigurationManager {
    * Validate current configuration
    */
   public validate(): { valid: boolean; errors: string[] } {
+    if (!this.validationResult) {
+      this.validationResult = this.runValidation();
+    }
+    return this.validationResult;
+  }
+
+  private runValidation(): { valid: boolean; errors: string[] } {
     try {
       ConfigurationSchema.parse(this.config);
       return { valid: true, errors: [] };
@@ -464,6 +477,13 @@ export class ConfigurationManager {
    * Get configuration summary for debugging
    */
   public getSummary(): Record<string, any> {
+    if (!this.summary) {
+      this.summary = Object.freeze(this.buildSummary());
+    }
+    return this.summary;
+  }
+
+  private buildSummary(): Record<string, any> {
     return {
       environment: this.config.app.environment,
       version: this.config.app.version,
@@ -690,21 +710,21 @@ export function getConfigSummary(): Record<string, any> {
  * Check if running in development mode
  */
 export function isDevelopment(): boolean {
-  return getConfigValue<string>("app.environment") === "development";
+  return getConfigSection("app").environment === "development";
 }
 
 /**
  * Check if running in production mode
  */
 export function isProduction(): boolean {
-  return getConfigValue<string>("app.environment") === "production";
+  return getConfigSection("app").environment === "production";
 }
 
 /**
  * Check if running in test mode
  */
 export function isTest(): boolean {
-  return getConfigValue<string>("app.environment") === "test";
+  return getConfigSection("app").environment === "test";
 }
 
 /**
@@ -713,7 +733,7 @@ export function isTest(): boolean {
 export function isFeatureEnabled(
   feature: keyof Configuration["trading"]["autoSniping"]
 ): boolean {
-  return getConfigValue<boolean>(`trading.autoSniping.${feature}`);
+  return getConfigSection("trading").autoSniping[feature] as boolean;
 }
 
 /**
@@ -731,7 +751,7 @@ export function getMexcCredentials(): { apiKey?: string; secretKey?: string } {
  * Check if MEXC credentials are configured
  */
 export function hasMexcCredentials(): boolean {
-  const { apiKey, secretKey } = getMexcCredentials();
+  const { apiKey, secretKey } = getConfigSection("mexc");
   return !!(apiKey && secretKey);
 }
 
@@ -22,6 +22,7 @@ import type {
   SystemOverviewResult,
 } from "./api-response";
 import { checkAuthTables, checkDatabaseHealth } from "./db-health-check";
+import { openai as sharedOpenAIClient } from "./openai-client";
 import { getSession } from "./supabase-auth";
 
 // ============================================================================
@@ -274,7 +275,11 @@ export class HealthCheckComponents {
         return result;
       }
 
-      const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
+      // Reuse the process-wide client rather than building a new one (and
+      // its HTTP agent) on every health check
+      const openai =
+        sharedOpenAIClient ??
+        new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
 
       // Simple test to verify API key works
       const models = await openai.models.list();
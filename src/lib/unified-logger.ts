@@ -81,6 +81,13 @@ export interface LoggerConfig {
 
 import type { ILogger } from "./structured-logger";
 
+const LOG_LEVEL_PRIORITY: Record<LogLevel, number> = {
+  debug: 0,
+  info: 1,
+  warn: 2,
+  error: 3,
+};
+
 export class UnifiedLogger implements ILogger {
   private config: LoggerConfig;
   private recentLogs: LogMetadata[] = [];
@@ -161,6 +168,7 @@ export class UnifiedLogger implements ILogger {
    * Trading-specific logging with specialized context
    */
   trading(operation: string, context: LogContext): void {
+    if (!this.shouldLog("info")) return;
     this.info(`Trading: ${operation}`, {
       ...context,
       operation: "trading",
@@ -177,6 +185,7 @@ export class UnifiedLogger implements ILogger {
     context?: LogContext
   ): void {
     const level = responseTime > 1000 ? "warn" : "info";
+    if (!this.shouldLog(level)) return;
     this.log(level, `API: ${method} ${endpoint}`, {
       ...context,
       operation: "api",
@@ -190,6 +199,7 @@ export class UnifiedLogger implements ILogger {
    * Database operation logging
    */
   database(operation: string, table?: string, context?: LogContext): void {
+    if (!this.shouldLog("info")) return;
     this.info(`Database: ${operation}`, {
       ...context,
       operation: "database",
@@ -209,6 +219,7 @@ export class UnifiedLogger implements ILogger {
    * Pattern detection logging
    */
   pattern(patternType: string, confidence: number, context?: LogContext): void {
+    if (!this.shouldLog("info")) return;
     this.info(`Pattern detected: ${patternType}`, {
       ...context,
       patternType,
@@ -221,6 +232,7 @@ export class UnifiedLogger implements ILogger {
    * Agent activity logging
    */
   agent(agentId: string, taskType: string, context?: LogContext): void {
+    if (!this.shouldLog("info")) return;
     this.info(`Agent ${agentId}: ${taskType}`, {
       ...context,
       agentId,
@@ -237,6 +249,7 @@ export class UnifiedLogger implements ILogger {
     key: string,
     context?: LogContext
   ): void {
+    if (!this.shouldLog("debug")) return;
     this.debug(`Cache ${operation}: ${key}`, {
       ...context,
       cacheOperation: operation,
@@ -250,6 +263,7 @@ export class UnifiedLogger implements ILogger {
    */
   safety(event: string, riskScore: number, context?: LogContext): void {
     const level = riskScore > 70 ? "warn" : "info";
+    if (!this.shouldLog(level)) return;
     this.log(level, `Safety: ${event}`, {
       ...context,
       riskScore,
@@ -295,14 +309,7 @@ export class UnifiedLogger implements ILogger {
   // ============================================================================
 
   private shouldLog(level: LogLevel): boolean {
-    const levels: Record<LogLevel, number> = {
-      debug: 0,
-      info: 1,
-      warn: 2,
-      error: 3,
-    };
-
-    return levels[level] >= levels[this.config.level];
+    return LOG_LEVEL_PRIORITY[level] >= LOG_LEVEL_PRIORITY[this.config.level];
   }
 
   private log(
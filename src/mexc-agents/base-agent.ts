@@ -1,4 +1,4 @@
-import OpenAI from "openai";
+import type OpenAI from "openai";
 import { UniversalCrypto } from "@/src/lib/browser-compatible-events";
 import { CACHE_CONSTANTS, TIME_CONSTANTS } from "@/src/lib/constants";
 import {
@@ -6,6 +6,7 @@ import {
   initializeAgentCache,
 } from "@/src/lib/enhanced-agent-cache";
 import { toSafeError } from "@/src/lib/error-type-utils";
+import { openai as sharedOpenAIClient } from "@/src/lib/openai-client";
 // Build-safe imports - avoid structured logger to prevent webpack bundling issues
 import { ErrorLoggingService } from "@/src/services/notification/error-logging-service";
 
@@ -48,6 +49,33 @@ export interface AgentResponse {
 
 export type AgentStatus = "idle" | "running" | "error" | "offline";
 
+// Ceiling on concurrent OpenAI requests across all agents to avoid
+// connection storms and provider rate limiting under bursty load.
+const OUTBOUND_CONCURRENCY =
+  Number.parseInt(process.env.OUTBOUND_CONCURRENCY || "", 10) || 32;
+let activeOutboundRequests = 0;
+const outboundWaiters: Array<() => void> = [];
+
+async function withOutboundSlot<T>(task: () => Promise<T>): Promise<T> {
+  if (activeOutboundRequests >= OUTBOUND_CONCURRENCY) {
+    await new Promise<void>((resolve) => outboundWaiters.push(resolve));
+  } else {
+    activeOutboundRequests++;
+  }
+
+  try {
+    return await task();
+  } finally {
+    const next = outboundWaiters.shift();
+    if (next) {
+      // Hand the slot directly to the next waiter
+      next();
+    } else {
+      activeOutboundRequests--;
+    }
+  }
+}
+
 export class BaseAgent {
   // Simple console logger to avoid webpack bundling issues
   protected logger = {
@@ -74,10 +102,10 @@ export class BaseAgent {
       ...config,
     };
     // FIXED: Add fallback handling for missing OpenAI API key
-    if (process.env.OPENAI_API_KEY) {
-      this.openai = new OpenAI({
-        apiKey: process.env.OPENAI_API_KEY,
-      });
+    // Agents use the process-wide client from openai-client so they share
+    // its keep-alive connection pool instead of opening their own
+    if (sharedOpenAIClient) {
+      this.openai = sharedOpenAIClient;
     } else {
       this.logger.warn(
         `[${this.config.name}] OpenAI API key not available - AI features will be disabled`
@@ -161,15 +189,22 @@ export class BaseAgent {
   ): Promise<AgentResponse> {
     const startTime = performance.now();
 
+    // Serialize the request and derive its local cache key once per call;
+    // both are reused for every cache lookup and write below.
+    const cacheInput = this.config.cacheEnabled
+      ? JSON.stringify(messages)
+      : "";
+    const cacheContext = { options, agent: this.config.name };
+    const cacheKey = this.config.cacheEnabled
+      ? this.generateCacheKey(messages, options)
+      : "";
+
     // Check enhanced agent cache first if enabled
     if (this.config.cacheEnabled) {
-      const input = JSON.stringify(messages);
-      const context = { options, agent: this.config.name };
-
       const enhancedCached = await globalEnhancedAgentCache.getAgentResponse(
         this.config.name,
-        input,
-        context
+        cacheInput,
+        cacheContext
       );
 
       if (enhancedCached) {
@@ -206,15 +241,14 @@ export class BaseAgent {
       }
 
       // Fallback to local cache
-      const cacheKey = this.generateCacheKey(messages, options);
       const cached = this.responseCache.get(cacheKey);
 
       if (cached && this.isCacheValid(cached)) {
         // Double-check with enhanced cache to ensure it hasn't been invalidated
         const enhancedCheck = await globalEnhancedAgentCache.getAgentResponse(
           this.config.name,
-          JSON.stringify(messages),
-          { options, agent: this.config.name }
+          cacheInput,
+          cacheContext
         );
 
         // If enhanced cache returns null, it means it was invalidated, so clear local cache too
@@ -245,19 +279,21 @@ export class BaseAgent {
         );
       }
 
-      const response = await this.openai.chat.completions.create({
-        model: this.config.model || "gpt-4o",
-        messages: [
-          {
-            role: "system",
-            content: this.config.systemPrompt,
-          },
-          ...messages,
-        ],
-        temperature: this.config.temperature || 0.7,
-        max_tokens: this.config.maxTokens || 2000,
-        ...options,
-      });
+      const response = await withOutboundSlot(() =>
+        this.openai.chat.completions.create({
+          model: this.config.model || "gpt-4o",
+          messages: [
+            {
+              role: "system",
+              content: this.config.systemPrompt,
+            },
+            ...messages,
+          ],
+          temperature: this.config.temperature || 0.7,
+          max_tokens: this.config.maxTokens || 2000,
+          ...options,
+        })
+      );
 
       const content =
         "choices" in response
@@ -282,9 +318,6 @@ export class BaseAgent {
       // Cache the response if caching is enabled
       if (this.config.cacheEnabled) {
         // Cache in enhanced agent cache first
-        const input = JSON.stringify(messages);
-        const context = { options, agent: this.config.name };
-
         // Convert base-agent AgentResponse to common-interfaces AgentResponse
         const commonAgentResponse: import("@/src/types/common-interfaces").AgentResponse =
           {
@@ -300,9 +333,9 @@ export class BaseAgent {
 
         await globalEnhancedAgentCache.setAgentResponse(
           this.config.name,
-          input,
+          cacheInput,
           commonAgentResponse,
-          context,
+          cacheContext,
           {
             ttl: this.config.cacheTTL || this.defaultCacheTTL,
             priority: this.determineResponsePriority(agentResponse),
@@ -311,7 +344,6 @@ export class BaseAgent {
         );
 
         // Also cache locally for fallback
-        const cacheKey = this.generateCacheKey(messages, options);
         const now = Date.now();
         this.responseCache.set(cacheKey, {
           response: agentResponse,
@@ -32,6 +32,9 @@ export interface ProcessedCalendarEntry extends CalendarEntry {
   tradingPairs: string[];
 }
 
+// Cap on listings embedded in the analysis prompt to keep LLM context bounded
+const MAX_PROMPT_LISTINGS = 50;
+
 export class CalendarAgent extends BaseAgent {
   // Simple console logger to avoid webpack bundling issues
   protected get agentLogger() {
@@ -191,12 +194,27 @@ Focus on opportunities providing ${request.minimumAdvanceHours || 3.5}+ hours ad
       // Process calendar data to identify new and upcoming listings
       const processedListings = this.preprocessCalendarData(calendarData);
 
+      // Bound the prompt to upcoming listings (next launch first), then fill
+      // any remaining room with the newest recent launches. The list is
+      // sorted by launch time, so recent entries are reversed to put the
+      // latest first. The full set still feeds the structured summary below.
+      const upcomingListings = processedListings.filter(
+        (listing) => listing.isUpcoming
+      );
+      const recentListings = processedListings
+        .filter((listing) => listing.isRecent)
+        .reverse();
+      const promptListings = [...upcomingListings, ...recentListings].slice(
+        0,
+        MAX_PROMPT_LISTINGS
+      );
+
       // Create comprehensive analysis prompt
       const userMessage = `
 MEXC Calendar Analysis - New Listing Discovery
 
 Calendar Data Analysis:
-${JSON.stringify(processedListings, null, 2)}
+${JSON.stringify(promptListings)}
 
 **Task: Identify and analyze new cryptocurrency listings from MEXC calendar data**
 
@@ -320,7 +338,7 @@ Focus on actionable intelligence for cryptocurrency trading preparation.
           tradingPairs: [`${entry.symbol}USDT`],
         };
       })
-      .sort((a, b) => a.advanceHours - b.advanceHours); // Sort by launch time (soonest first)
+      .sort((a, b) => a.advanceHours - b.advanceHours); // Sort by launch time (earliest first)
   }
 
   // Calculate urgency level based on advance notice
@@ -541,7 +559,7 @@ Focus on actionable intelligence for cryptocurrency trading preparation.
 MEXC Listing Timing Analysis:
 
 Listing Data:
-${JSON.stringify(listingData, null, 2)}
+${JSON.stringify(listingData)}
 
 Please analyze the timing aspects of this listing:
 
@@ -593,7 +611,7 @@ Provide specific timestamps and a detailed action timeline with confidence level
 MEXC Project Market Potential Assessment:
 
 Project Data:
-${JSON.stringify(projectData, null, 2)}
+${JSON.stringify(projectData)}
 
 Please assess the market potential and trading appeal:
 
@@ -647,7 +665,7 @@ Provide a comprehensive assessment with specific scores and recommendations.
   async createMonitoringPlan(
     discoveredListings: NewListingData[]
   ): Promise<AgentResponse> {
-    const listingsJson = JSON.stringify(discoveredListings, null, 2);
+    const listingsJson = JSON.stringify(discoveredListings);
 
     const userMessage = `
 MEXC Monitoring Plan Creation:
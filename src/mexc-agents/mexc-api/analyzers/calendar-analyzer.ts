@@ -81,11 +81,12 @@ Focus on actionable insights for trading preparation and opportunity identificat
   /**
    * Calculate launch readiness score
    */
-  calculateLaunchReadiness(entry: MexcCalendarEntry): number {
+  calculateLaunchReadiness(
+    entry: MexcCalendarEntry,
+    now: number = Date.now()
+  ): number {
     let score = 0;
-    const now = new Date();
-    const launchTime = new Date(entry.launchTime);
-    const timeUntilLaunch = launchTime.getTime() - now.getTime();
+    const timeUntilLaunch = new Date(entry.launchTime).getTime() - now;
     const hoursUntilLaunch = timeUntilLaunch / (1000 * 60 * 60);
 
     // Score based on time until launch
@@ -109,10 +110,15 @@ Focus on actionable insights for trading preparation and opportunity identificat
    * Prioritize calendar entries by trading potential
    */
   prioritizeEntries(calendarData: MexcCalendarEntry[]): MexcCalendarEntry[] {
-    return [...calendarData].sort((a, b) => {
-      const scoreA = this.calculateLaunchReadiness(a);
-      const scoreB = this.calculateLaunchReadiness(b);
-      return scoreB - scoreA;
-    });
+    // Score each entry once against a single clock reading instead of
+    // rescoring both sides of every comparison
+    const now = Date.now();
+    return calendarData
+      .map((entry) => ({
+        entry,
+        score: this.calculateLaunchReadiness(entry, now),
+      }))
+      .sort((a, b) => b.score - a.score)
+      .map(({ entry }) => entry);
   }
 }
@@ -4,7 +4,10 @@
  * Enhances API responses with AI analysis and additional metadata
  */
 
-import type { SymbolEntry } from "@/src/schemas/unified/mexc-api-schemas";
+import {
+  READY_STATE_PATTERN,
+  type SymbolEntry,
+} from "@/src/schemas/unified/mexc-api-schemas";
 import type { CalendarEntry } from "@/src/services/api/mexc-client-types";
 import type { ServiceResponse } from "@/src/services/api/mexc-unified-exports";
 import type { AgentResponse } from "../../base-agent";
@@ -167,8 +170,11 @@ export class ResponseEnhancer {
     return entries.map((entry) => ({
       symbol: `${entry.cd}USDT`,
       vcoinId: entry.cd,
-      status: entry.sts === 2 ? "ready" : "pending",
-      isTrading: entry.sts === 2 && entry.st === 2 && entry.tt === 4,
+      status: entry.sts === READY_STATE_PATTERN.sts ? "ready" : "pending",
+      isTrading:
+        entry.sts === READY_STATE_PATTERN.sts &&
+        entry.st === READY_STATE_PATTERN.st &&
+        entry.tt === READY_STATE_PATTERN.tt,
       hasCompleteData: Boolean(
         entry.cd &&
           entry.sts !== undefined &&
@@ -116,14 +116,14 @@ Timeframe: ${request.timeframe || "real-time"}
 ${
   request.symbolData
     ? `Symbol Data:
-${JSON.stringify(request.symbolData, null, 2)}`
+${JSON.stringify(request.symbolData)}`
     : ""
 }
 
 ${
   request.calendarData
     ? `Calendar Data:
-${JSON.stringify(request.calendarData, null, 2)}`
+${JSON.stringify(request.calendarData)}`
     : ""
 }
 
@@ -190,7 +190,7 @@ Provide specific pattern matches with confidence levels and clear action items.
 MEXC Pattern Discovery - Calendar Analysis
 
 Calendar Entries Analysis:
-${JSON.stringify(processedData, null, 2)}
+${JSON.stringify(processedData)}
 
 **Primary Task: Identify early-stage patterns indicating future price movements and trading opportunities**
 
@@ -561,7 +561,7 @@ MEXC Ready State Pattern Validation:
 VCoin ID: ${params.vcoinId}
 Data Count: ${params.count} entries
 Symbol Data:
-${JSON.stringify(params.symbolData, null, 2)}
+${JSON.stringify(params.symbolData)}
 
 Please perform comprehensive validation of the MEXC ready state pattern:
 
@@ -640,7 +640,7 @@ Focus on precise pattern matching and actionable timing recommendations.
 MEXC Early Opportunity Identification:
 
 Market Data:
-${JSON.stringify(marketData, null, 2)}
+${JSON.stringify(marketData)}
 
 Please identify early-stage trading opportunities before the standard ready state:
 
@@ -687,7 +687,7 @@ Focus on opportunities that provide 3.5+ hours advance notice for optimal positi
 MEXC Pattern Reliability Assessment:
 
 Pattern Data:
-${JSON.stringify(patternData, null, 2)}
+${JSON.stringify(patternData)}
 
 Please assess the reliability and confidence level of this pattern:
 
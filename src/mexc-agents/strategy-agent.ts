@@ -490,7 +490,7 @@ Always provide detailed, actionable insights with proper risk management conside
 
   async analyzeStrategy(strategy: any): Promise<StrategyResponse> {
     const prompt = `Analyze the following trading strategy:
-    ${JSON.stringify(strategy, null, 2)}
+    ${JSON.stringify(strategy)}
     
     Provide insights on:
     - Performance potential
@@ -517,8 +517,8 @@ Always provide detailed, actionable insights with proper risk management conside
     parameters: Record<string, any>
   ): Promise<StrategyResponse> {
     const prompt = `Optimize the following trading strategy:
-    Strategy: ${JSON.stringify(strategy, null, 2)}
-    Parameters: ${JSON.stringify(parameters, null, 2)}
+    Strategy: ${JSON.stringify(strategy)}
+    Parameters: ${JSON.stringify(parameters)}
     
     Suggest specific optimizations for:
     - Entry/exit timing
@@ -542,7 +542,7 @@ Always provide detailed, actionable insights with proper risk management conside
 
   async getRecommendations(marketConditions?: any): Promise<StrategyResponse> {
     const prompt = `Provide trading strategy recommendations based on current market conditions:
-    ${marketConditions ? JSON.stringify(marketConditions, null, 2) : "General market analysis"}
+    ${marketConditions ? JSON.stringify(marketConditions) : "General market analysis"}
     
     Include:
     - Recommended strategy types
@@ -615,18 +615,16 @@ Always provide detailed, actionable insights with proper risk management conside
     Risk Tolerance: ${request.riskTolerance || "medium"}
     Capital: ${request.capital || "Not specified"}
     Entry Price: ${request.entryPrice || "Market price"}
-    Market Data: ${request.marketData ? JSON.stringify(request.marketData, null, 2) : "General market analysis"}
+    Market Data: ${request.marketData ? JSON.stringify(request.marketData) : "General market analysis"}
     Objectives: ${request.objectives?.join(", ") || "Profit maximization with risk management"}
-    Phases: ${JSON.stringify(phases, null, 2)}
+    Phases: ${JSON.stringify(phases)}
     Risk Management: ${JSON.stringify(
       request.riskManagement || {
         maxRisk: "5%",
         stopLoss: "3%",
         takeProfit: "10%",
         positionSizing: "2% of capital",
-      },
-      null,
-      2
+      }
     )}
     
     Provide a comprehensive multi-phase strategy with:
@@ -687,9 +685,9 @@ Always provide detailed, actionable insights with proper risk management conside
   ): Promise<StrategyResponse> {
     const prompt = `Optimize the following existing trading strategy based on performance data and market conditions:
     
-    Strategy: ${JSON.stringify(strategy, null, 2)}
-    Performance Data: ${JSON.stringify(performanceData, null, 2)}
-    Market Conditions: ${marketConditions ? JSON.stringify(marketConditions, null, 2) : "Not specified"}
+    Strategy: ${JSON.stringify(strategy)}
+    Performance Data: ${JSON.stringify(performanceData)}
+    Market Conditions: ${marketConditions ? JSON.stringify(marketConditions) : "Not specified"}
     
     Provide specific optimizations for:
     - Entry/exit timing improvements
@@ -732,7 +730,7 @@ Always provide detailed, actionable insights with proper risk management conside
     const prompt = `Recommend a trading strategy specifically for ${symbol} based on:
     
     Symbol: ${symbol}
-    Market Data: ${marketData ? JSON.stringify(marketData, null, 2) : "General market analysis"}
+    Market Data: ${marketData ? JSON.stringify(marketData) : "General market analysis"}
     Risk Profile: ${riskProfile || "medium"}
     
     Provide symbol-specific strategy recommendations including:
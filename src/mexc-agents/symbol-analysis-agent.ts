@@ -31,6 +31,9 @@ export interface SymbolStatus {
 }
 
 export class SymbolAnalysisAgent extends BaseAgent {
+  // Readiness analyses currently awaiting OpenAI, keyed by symbol + snapshot
+  private inFlightReadiness = new Map<string, Promise<AgentResponse>>();
+
   constructor() {
     const config: AgentConfig = {
       name: "symbol-analysis-agent",
@@ -167,12 +170,25 @@ Provide clear READY/NOT READY determination with detailed confidence metrics and
     vcoinId: string,
     symbolData: SymbolData | SymbolData[]
   ): Promise<AgentResponse> {
-    const dataJson = JSON.stringify(symbolData, null, 2);
+    const dataJson = JSON.stringify(symbolData);
+    const key = `${vcoinId.toUpperCase()}:${dataJson}`;
+
+    // Concurrent requests for the same symbol snapshot share one LLM call;
+    // repeats after it settles are served by the base agent response cache.
+    const inFlight = this.inFlightReadiness.get(key);
+    if (inFlight) {
+      return inFlight;
+    }
 
-    return await this.process(dataJson, {
+    const analysis = this.process(dataJson, {
       vcoinId,
       analysisDepth: "comprehensive",
+    }).finally(() => {
+      this.inFlightReadiness.delete(key);
     });
+    this.inFlightReadiness.set(key, analysis);
+
+    return await analysis;
   }
 
   async validateReadyStatePattern(
@@ -182,7 +198,7 @@ Provide clear READY/NOT READY determination with detailed confidence metrics and
 MEXC Ready State Pattern Validation:
 
 Symbol Data:
-${JSON.stringify(symbolData, null, 2)}
+${JSON.stringify(symbolData)}
 
 Please validate the ready state pattern with strict criteria:
 
@@ -255,7 +271,7 @@ MEXC Market Microstructure Analysis:
 
 VCoin ID: ${params.vcoinId}
 Symbol Data:
-${JSON.stringify(params.symbolData, null, 2)}
+${JSON.stringify(params.symbolData)}
 
 Please analyze the market microstructure and trading conditions for this specific symbol:
 
@@ -327,7 +343,7 @@ MEXC Symbol Monitoring Plan Generation:
 
 VCoin ID: ${vcoinId}
 Current Status:
-${JSON.stringify(currentStatus, null, 2)}
+${JSON.stringify(currentStatus)}
 
 Please create a detailed monitoring plan based on current symbol status:
 
@@ -9,6 +9,7 @@ import type {
   PatternDiscoveryMessage,
   PatternReadyStateMessage,
 } from "@/src/lib/websocket-types";
+import { READY_STATE_PATTERN } from "@/src/schemas/unified/mexc-api-schemas";
 import { webSocketServer } from "@/src/services/data/websocket-server";
 import type { PatternDiscoveryData, ReadyStateData } from "../types";
 
@@ -47,7 +48,10 @@ export class PatternDiscoveryStreamer {
   }
 
   broadcastReadyStatePattern(data: ReadyStateData): void {
-    const isReady = data.sts === 2 && data.st === 2 && data.tt === 4;
+    const isReady =
+      data.sts === READY_STATE_PATTERN.sts &&
+      data.st === READY_STATE_PATTERN.st &&
+      data.tt === READY_STATE_PATTERN.tt;
     const advanceNotice = data.estimatedLaunchTime
       ? data.estimatedLaunchTime - Date.now()
       : 0;
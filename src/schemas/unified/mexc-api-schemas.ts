@@ -535,10 +535,16 @@ export function hasCompleteData(data: any): boolean {
  * Check if symbol is valid for sniping
  */
 export function isValidForSnipe(symbolData: SymbolEntry): boolean {
-  if (!symbolData || !hasCompleteData(symbolData)) return false;
-
-  // Check ready state pattern
-  return symbolData.sts === 2 && symbolData.st === 2 && symbolData.tt === 4;
+  if (!symbolData) return false;
+
+  // Check the ready state pattern first: it rejects almost every symbol with
+  // a single comparison, so the field checks only run for ready candidates
+  return (
+    symbolData.sts === READY_STATE_PATTERN.sts &&
+    symbolData.st === READY_STATE_PATTERN.st &&
+    symbolData.tt === READY_STATE_PATTERN.tt &&
+    hasCompleteData(symbolData)
+  );
 }
 
 /**
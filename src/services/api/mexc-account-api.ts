@@ -14,6 +14,9 @@ import type {
 import { BalanceEntrySchema } from "./mexc-client-types";
 import { MexcMarketDataClient } from "./mexc-market-data";
 
+// Maximum concurrent ticker requests when valuing account balances
+const PRICE_FETCH_CONCURRENCY = 5;
+
 // ============================================================================
 // Account API Client
 // ============================================================================
@@ -240,7 +243,7 @@ export class MexcAccountApiClient extends MexcMarketDataClient {
       // Fetch prices for specific symbols
       const priceMap = new Map<string, number>();
 
-      for (const symbol of symbolsNeeded) {
+      const fetchSymbolPrice = async (symbol: string): Promise<void> => {
         try {
           console.info(`[MexcAccountApi] Fetching price for ${symbol}...`);
           const tickerResponse = await this.get24hrTicker(symbol);
@@ -286,6 +289,20 @@ export class MexcAccountApiClient extends MexcMarketDataClient {
             error
           );
         }
+      };
+
+      // Tickers are independent, so fetch a few at a time rather than
+      // waiting on each request in turn
+      for (
+        let start = 0;
+        start < symbolsNeeded.length;
+        start += PRICE_FETCH_CONCURRENCY
+      ) {
+        await Promise.all(
+          symbolsNeeded
+            .slice(start, start + PRICE_FETCH_CONCURRENCY)
+            .map(fetchSymbolPrice)
+        );
       }
 
       // Process balances with fetched prices
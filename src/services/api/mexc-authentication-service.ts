@@ -335,33 +335,12 @@ export class MexcAuthenticationService {
     }
 
     try {
-      const iv = crypto.randomBytes(16);
-      const cipher = crypto.createCipheriv(
-        "aes-256-cbc",
-        Buffer.from(this.config.encryptionKey, "hex"),
-        iv
-      );
-      const encryptedApiKey =
-        iv.toString("hex") +
-        ":" +
-        cipher.update(this.config.apiKey, "utf8", "hex") +
-        cipher.final("hex");
-
-      const iv2 = crypto.randomBytes(16);
-      const cipher2 = crypto.createCipheriv(
-        "aes-256-cbc",
-        Buffer.from(this.config.encryptionKey, "hex"),
-        iv2
-      );
-      const encryptedSecretKey =
-        iv2.toString("hex") +
-        ":" +
-        cipher2.update(this.config.secretKey, "utf8", "hex") +
-        cipher2.final("hex");
+      // Decode the key once for both fields
+      const key = Buffer.from(this.config.encryptionKey, "hex");
 
       return {
-        apiKey: encryptedApiKey,
-        secretKey: encryptedSecretKey,
+        apiKey: this.sealCredential(key, this.config.apiKey),
+        secretKey: this.sealCredential(key, this.config.secretKey),
       };
     } catch (error) {
       this.logger.error(
@@ -373,6 +352,35 @@ export class MexcAuthenticationService {
     }
   }
 
+  /**
+   * Encrypt a single credential field as "<iv hex>:<ciphertext hex>"
+   */
+  private sealCredential(key: Buffer, plaintext: string): string {
+    const iv = crypto.randomBytes(16);
+    const cipher = crypto.createCipheriv("aes-256-cbc", key, iv);
+    return (
+      iv.toString("hex") +
+      ":" +
+      cipher.update(plaintext, "utf8", "hex") +
+      cipher.final("hex")
+    );
+  }
+
+  /**
+   * Decrypt a single credential field produced by sealCredential
+   */
+  private openCredential(key: Buffer, sealed: string): string {
+    const [ivHex, encryptedText] = sealed.split(":");
+    const decipher = crypto.createDecipheriv(
+      "aes-256-cbc",
+      key,
+      Buffer.from(ivHex, "hex")
+    );
+    return (
+      decipher.update(encryptedText, "hex", "utf8") + decipher.final("utf8")
+    );
+  }
+
   /**
    * Set credentials from encrypted storage
    */
@@ -388,28 +396,10 @@ export class MexcAuthenticationService {
     }
 
     try {
-      const apiKeyParts = encrypted.apiKey.split(":");
-      const iv = Buffer.from(apiKeyParts[0], "hex");
-      const encryptedText = apiKeyParts[1];
-      const decipher = crypto.createDecipheriv(
-        "aes-256-cbc",
-        Buffer.from(this.config.encryptionKey, "hex"),
-        iv
-      );
-      const apiKey =
-        decipher.update(encryptedText, "hex", "utf8") + decipher.final("utf8");
-
-      const secretKeyParts = encrypted.secretKey.split(":");
-      const iv2 = Buffer.from(secretKeyParts[0], "hex");
-      const encryptedText2 = secretKeyParts[1];
-      const decipher2 = crypto.createDecipheriv(
-        "aes-256-cbc",
-        Buffer.from(this.config.encryptionKey, "hex"),
-        iv2
-      );
-      const secretKey =
-        decipher2.update(encryptedText2, "hex", "utf8") +
-        decipher2.final("utf8");
+      // Decode the key once for both fields
+      const key = Buffer.from(this.config.encryptionKey, "hex");
+      const apiKey = this.openCredential(key, encrypted.apiKey);
+      const secretKey = this.openCredential(key, encrypted.secretKey);
 
       await this.updateCredentials({ apiKey, secretKey });
       return true;
@@ -91,23 +91,20 @@ export class MexcMarketDataClient extends MexcClientCore {
               "firstOpenTime" in entry &&
               Boolean(entry.firstOpenTime)
           )
-          .map((entry: any): CalendarEntry | undefined => {
-            try {
-              return CalendarEntrySchema.parse({
-                vcoinId: String(entry.vcoinId),
-                symbol: String(entry.vcoinName), // MEXC uses vcoinName for symbol
-                projectName: String(entry.vcoinNameFull || entry.vcoinName), // MEXC uses vcoinNameFull for full project name
-                firstOpenTime: Number(entry.firstOpenTime),
-              });
-            } catch (_error) {
+          // safeParse avoids throwing (and catching) for every invalid entry
+          .flatMap((entry: any): CalendarEntry[] => {
+            const result = CalendarEntrySchema.safeParse({
+              vcoinId: String(entry.vcoinId),
+              symbol: String(entry.vcoinName), // MEXC uses vcoinName for symbol
+              projectName: String(entry.vcoinNameFull || entry.vcoinName), // MEXC uses vcoinNameFull for full project name
+              firstOpenTime: Number(entry.firstOpenTime),
+            });
+            if (!result.success) {
               console.warn("[MexcMarketData] Invalid calendar entry:", entry);
-              return undefined;
+              return [];
             }
-          })
-          .filter(
-            (entry: CalendarEntry | undefined): entry is CalendarEntry =>
-              entry !== undefined
-          );
+            return [result.data];
+          });
       }
       // Fallback: check if data is directly an array (for backward compatibility)
       else if (response.data?.data && Array.isArray(response.data.data)) {
@@ -123,23 +120,19 @@ export class MexcMarketDataClient extends MexcClientCore {
               "firstOpenTime" in entry &&
               Boolean(entry.firstOpenTime)
           )
-          .map((entry: any): CalendarEntry | undefined => {
-            try {
-              return CalendarEntrySchema.parse({
-                vcoinId: String(entry.vcoinId),
-                symbol: String(entry.symbol),
-                projectName: String(entry.projectName || entry.symbol),
-                firstOpenTime: Number(entry.firstOpenTime),
-              });
-            } catch (_error) {
+          .flatMap((entry: any): CalendarEntry[] => {
+            const result = CalendarEntrySchema.safeParse({
+              vcoinId: String(entry.vcoinId),
+              symbol: String(entry.symbol),
+              projectName: String(entry.projectName || entry.symbol),
+              firstOpenTime: Number(entry.firstOpenTime),
+            });
+            if (!result.success) {
               console.warn("[MexcMarketData] Invalid calendar entry:", entry);
-              return undefined;
+              return [];
             }
-          })
-          .filter(
-            (entry: CalendarEntry | undefined): entry is CalendarEntry =>
-              entry !== undefined
-          );
+            return [result.data];
+          });
       }
 
       console.info(
@@ -220,24 +213,23 @@ export class MexcMarketDataClient extends MexcClientCore {
               entry.tt !== undefined
             );
           })
-          .map((entry): SymbolEntry | null => {
-            try {
-              return SymbolEntrySchema.parse({
-                cd: String(entry.cd),
-                sts: Number(entry.sts),
-                st: Number(entry.st),
-                tt: Number(entry.tt),
-                ca: entry.ca as Record<string, unknown>,
-                ps: entry.ps as Record<string, unknown>,
-                qs: entry.qs as Record<string, unknown>,
-                ot: entry.ot as Record<string, unknown>,
-              });
-            } catch (_error) {
+          .flatMap((entry): SymbolEntry[] => {
+            const result = SymbolEntrySchema.safeParse({
+              cd: String(entry.cd),
+              sts: Number(entry.sts),
+              st: Number(entry.st),
+              tt: Number(entry.tt),
+              ca: entry.ca as Record<string, unknown>,
+              ps: entry.ps as Record<string, unknown>,
+              qs: entry.qs as Record<string, unknown>,
+              ot: entry.ot as Record<string, unknown>,
+            });
+            if (!result.success) {
               console.warn("[MexcMarketData] Invalid symbol entry:", entry);
-              return null;
+              return [];
             }
-          })
-          .filter((entry): entry is SymbolEntry => entry !== null);
+            return [result.data];
+          });
       }
 
       console.info(
@@ -10,6 +10,18 @@
  * - Secure key storage patterns
  */
 
+import {
+  createCipheriv,
+  createDecipheriv,
+  pbkdf2,
+  pbkdf2Sync,
+  randomBytes,
+} from "node:crypto";
+import { promisify } from "node:util";
+
+// Async PBKDF2 runs on the libuv threadpool instead of the event loop
+const pbkdf2Async = promisify(pbkdf2);
+
 // Constants for cryptographic operations
 const ALGORITHM = "aes-256-gcm";
 const SALT_LENGTH = 32; // 256 bits
@@ -18,6 +30,8 @@ const _TAG_LENGTH = 16; // 128 bits
 const KEY_LENGTH = 32; // 256 bits
 const PBKDF2_ITERATIONS = 100000; // OWASP recommendation
 const PBKDF2_DIGEST = "sha256";
+// Derived keys kept per instance, keyed by salt (see rememberDerivedKey)
+const DERIVED_KEY_CACHE_SIZE = 256;
 
 // Version for key rotation support
 const CURRENT_VERSION = 1;
@@ -31,6 +45,18 @@ interface EncryptedData {
   ciphertext: string;
 }
 
+/**
+ * Thrown when stored data can't be decrypted (wrong master key, tampered or
+ * malformed ciphertext). This is an expected failure, e.g. after a key
+ * rotation, so callers can handle it without treating it as a crash.
+ */
+export class DecryptionError extends Error {
+  constructor(message = "Failed to decrypt data") {
+    super(message);
+    this.name = "DecryptionError";
+  }
+}
+
 export class SecureEncryptionService {
   private _logger?: {
     info: (message: string, context?: any) => void;
@@ -61,6 +87,7 @@ export class SecureEncryptionService {
 
   private masterKey: Buffer;
   private keyId: string;
+  private derivedKeys = new Map<string, Buffer>();
 
   constructor() {
     // Validate and load master key from environment
@@ -110,29 +137,7 @@ export class SecureEncryptionService {
         PBKDF2_DIGEST
       );
 
-      // Create cipher
-      const cipher = createCipheriv(ALGORITHM, derivedKey, nonce);
-
-      // Encrypt data
-      const ciphertext = Buffer.concat([
-        cipher.update(plaintext, "utf8"),
-        cipher.final(),
-      ]);
-
-      // Get authentication tag
-      const tag = cipher.getAuthTag();
-
-      // Combine all components into a structured format
-      const encryptedData: EncryptedData = {
-        version: CURRENT_VERSION,
-        salt: salt.toString("base64"),
-        nonce: nonce.toString("base64"),
-        tag: tag.toString("base64"),
-        ciphertext: ciphertext.toString("base64"),
-      };
-
-      // Return as base64-encoded JSON
-      return Buffer.from(JSON.stringify(encryptedData)).toString("base64");
+      return this.sealWithKey(plaintext, derivedKey, salt, nonce);
     } catch (error) {
       this.getLogger().error("[Encryption] Encryption failed:", error);
       throw new Error("Failed to encrypt data");
@@ -140,30 +145,14 @@ export class SecureEncryptionService {
   }
 
   /**
-   * Decrypts data encrypted with encrypt()
+   * Same as encrypt(), but derives the key off the event loop so request
+   * handlers stay responsive while PBKDF2 runs.
    */
-  decrypt(encryptedText: string): string {
+  async encryptAsync(plaintext: string): Promise<string> {
     try {
-      // Parse the encrypted data structure
-      const encryptedData: EncryptedData = JSON.parse(
-        Buffer.from(encryptedText, "base64").toString("utf8")
-      );
-
-      // Version check for future compatibility
-      if (encryptedData.version !== CURRENT_VERSION) {
-        throw new Error(
-          `Unsupported encryption version: ${encryptedData.version}`
-        );
-      }
-
-      // Decode components
-      const salt = Buffer.from(encryptedData.salt, "base64");
-      const nonce = Buffer.from(encryptedData.nonce, "base64");
-      const tag = Buffer.from(encryptedData.tag, "base64");
-      const ciphertext = Buffer.from(encryptedData.ciphertext, "base64");
-
-      // Derive the same key using PBKDF2
-      const derivedKey = pbkdf2Sync(
+      const salt = randomBytes(SALT_LENGTH);
+      const nonce = randomBytes(NONCE_LENGTH);
+      const derivedKey = await pbkdf2Async(
         this.masterKey,
         salt,
         PBKDF2_ITERATIONS,
@@ -171,25 +160,177 @@ export class SecureEncryptionService {
         PBKDF2_DIGEST
       );
 
-      // Create decipher
-      const decipher = createDecipheriv(ALGORITHM, derivedKey, nonce);
-      decipher.setAuthTag(tag);
+      return this.sealWithKey(plaintext, derivedKey, salt, nonce);
+    } catch (error) {
+      this.getLogger().error("[Encryption] Encryption failed:", error);
+      throw new Error("Failed to encrypt data");
+    }
+  }
 
-      // Decrypt and verify authentication
-      const plaintext = Buffer.concat([
-        decipher.update(ciphertext),
-        decipher.final(),
-      ]);
+  /**
+   * Decrypts data encrypted with encrypt()
+   */
+  decrypt(encryptedText: string): string {
+    try {
+      const encryptedData = this.parseEncryptedData(encryptedText);
+
+      // Derive the same key using PBKDF2, unless this salt was seen recently
+      const derivedKey =
+        this.derivedKeys.get(encryptedData.salt) ??
+        this.rememberDerivedKey(
+          encryptedData.salt,
+          pbkdf2Sync(
+            this.masterKey,
+            Buffer.from(encryptedData.salt, "base64"),
+            PBKDF2_ITERATIONS,
+            KEY_LENGTH,
+            PBKDF2_DIGEST
+          )
+        );
 
-      return plaintext.toString("utf8");
+      return this.openWithKey(encryptedData, derivedKey);
     } catch (error) {
-      this.getLogger().error("[Encryption] Decryption failed:", error);
+      this.logDecryptionFailure(error);
 
       // Don't leak information about why decryption failed
-      throw new Error("Failed to decrypt data");
+      throw new DecryptionError();
     }
   }
 
+  /**
+   * Same as decrypt(), but derives the key off the event loop
+   */
+  async decryptAsync(encryptedText: string): Promise<string> {
+    try {
+      const encryptedData = this.parseEncryptedData(encryptedText);
+      const derivedKey =
+        this.derivedKeys.get(encryptedData.salt) ??
+        this.rememberDerivedKey(
+          encryptedData.salt,
+          await pbkdf2Async(
+            this.masterKey,
+            Buffer.from(encryptedData.salt, "base64"),
+            PBKDF2_ITERATIONS,
+            KEY_LENGTH,
+            PBKDF2_DIGEST
+          )
+        );
+
+      return this.openWithKey(encryptedData, derivedKey);
+    } catch (error) {
+      this.logDecryptionFailure(error);
+      throw new DecryptionError();
+    }
+  }
+
+  /**
+   * Every ciphertext carries its own random salt, so a stored credential
+   * always derives the same key. Keeping recent derivations lets repeat
+   * decrypts of the same record skip the 100k-round PBKDF2. Only the
+   * decrypt path fills the cache: a fresh encrypt salt is never looked up
+   * again by this instance unless that record is decrypted later. The oldest
+   * entry is dropped once the cache is full.
+   */
+  private rememberDerivedKey(salt: string, derivedKey: Buffer): Buffer {
+    if (this.derivedKeys.size >= DERIVED_KEY_CACHE_SIZE) {
+      const oldest = this.derivedKeys.keys().next().value;
+      if (oldest !== undefined) {
+        this.derivedKeys.delete(oldest);
+      }
+    }
+    this.derivedKeys.set(salt, derivedKey);
+    return derivedKey;
+  }
+
+  private logDecryptionFailure(error: unknown): void {
+    // Only the reason is logged; formatting a full stack for every bad
+    // ciphertext is wasted work on a failure that is expected
+    this.getLogger().warn("[Encryption] Decryption failed:", {
+      reason: error instanceof Error ? error.message : String(error),
+    });
+  }
+
+  private sealWithKey(
+    plaintext: string,
+    derivedKey: Buffer,
+    salt: Buffer,
+    nonce: Buffer
+  ): string {
+    // Create cipher (Node routes AES-GCM through OpenSSL's AES-NI path)
+    const cipher = createCipheriv(ALGORITHM, derivedKey, nonce);
+
+    // Encrypt data
+    const ciphertext = Buffer.concat([
+      cipher.update(plaintext, "utf8"),
+      cipher.final(),
+    ]);
+
+    // Get authentication tag
+    const tag = cipher.getAuthTag();
+
+    // Combine all components into a structured format
+    const encryptedData: EncryptedData = {
+      version: CURRENT_VERSION,
+      salt: salt.toString("base64"),
+      nonce: nonce.toString("base64"),
+      tag: tag.toString("base64"),
+      ciphertext: ciphertext.toString("base64"),
+    };
+
+    // The components are already base64, so the JSON envelope is stored
+    // as-is rather than base64-encoded a second time
+    return JSON.stringify(encryptedData);
+  }
+
+  /**
+   * Returns the JSON envelope of a stored ciphertext. Records written before
+   * the envelope was stored directly are base64-wrapped; base64 never starts
+   * with "{", so those are detected and unwrapped.
+   */
+  private decodeEnvelope(encryptedText: string): string {
+    return encryptedText.startsWith("{")
+      ? encryptedText
+      : Buffer.from(encryptedText, "base64").toString("utf8");
+  }
+
+  private parseEncryptedData(encryptedText: string): EncryptedData {
+    // Parse the encrypted data structure
+    const encryptedData: EncryptedData = JSON.parse(
+      this.decodeEnvelope(encryptedText)
+    );
+
+    // Version check for future compatibility
+    if (encryptedData.version !== CURRENT_VERSION) {
+      throw new Error(
+        `Unsupported encryption version: ${encryptedData.version}`
+      );
+    }
+
+    return encryptedData;
+  }
+
+  private openWithKey(
+    encryptedData: EncryptedData,
+    derivedKey: Buffer
+  ): string {
+    // Decode components
+    const nonce = Buffer.from(encryptedData.nonce, "base64");
+    const tag = Buffer.from(encryptedData.tag, "base64");
+    const ciphertext = Buffer.from(encryptedData.ciphertext, "base64");
+
+    // Create decipher
+    const decipher = createDecipheriv(ALGORITHM, derivedKey, nonce);
+    decipher.setAuthTag(tag);
+
+    // Decrypt and verify authentication
+    const plaintext = Buffer.concat([
+      decipher.update(ciphertext),
+      decipher.final(),
+    ]);
+
+    return plaintext.toString("utf8");
+  }
+
   /**
    * Re-encrypts data with a new salt and nonce (for key rotation)
    */
@@ -210,9 +351,7 @@ export class SecureEncryptionService {
    */
   isValidEncryptedFormat(encryptedText: string): boolean {
     try {
-      const data = JSON.parse(
-        Buffer.from(encryptedText, "base64").toString("utf8")
-      );
+      const data = JSON.parse(this.decodeEnvelope(encryptedText));
 
       return (
         typeof data.version === "number" &&
@@ -10,7 +10,11 @@ import { and, eq } from "drizzle-orm";
 import { apiCredentials, db } from "@/src/db";
 import { UnifiedMexcClient } from "./mexc-client-factory";
 import type { UnifiedMexcConfig } from "./mexc-client-types";
-import { getEncryptionService } from "./secure-encryption-service";
+import {
+  DecryptionError,
+  getEncryptionService,
+} from "./secure-encryption-service";
+import { clearUserCredentialsCache } from "./user-credentials-service";
 
 // ============================================================================
 // Service Factory Configuration
@@ -513,7 +517,10 @@ export class UnifiedMexcServiceFactory {
       // Query database with improved timeout and error handling
       const credentials = await Promise.race([
         db
-          .select()
+          .select({
+            encryptedApiKey: apiCredentials.encryptedApiKey,
+            encryptedSecretKey: apiCredentials.encryptedSecretKey,
+          })
           .from(apiCredentials)
           .where(
             and(
@@ -540,12 +547,12 @@ export class UnifiedMexcServiceFactory {
 
       // Decrypt credentials with error handling
       try {
-        const apiKey = this.encryptionService.decrypt(
-          credentials[0].encryptedApiKey
-        );
-        const secretKey = this.encryptionService.decrypt(
-          credentials[0].encryptedSecretKey
-        );
+        const [apiKey, secretKey] = await Promise.all([
+          this.encryptionService.decryptAsync(credentials[0].encryptedApiKey),
+          this.encryptionService.decryptAsync(
+            credentials[0].encryptedSecretKey
+          ),
+        ]);
 
         // Validate decrypted credentials
         if (!apiKey || !secretKey) {
@@ -576,10 +583,16 @@ export class UnifiedMexcServiceFactory {
           source: "database",
         };
       } catch (decryptError) {
-        console.error(
-          "[UnifiedMexcServiceFactory] Failed to decrypt credentials:",
-          decryptError
-        );
+        if (decryptError instanceof DecryptionError) {
+          console.warn(
+            "[UnifiedMexcServiceFactory] Failed to decrypt credentials"
+          );
+        } else {
+          console.error(
+            "[UnifiedMexcServiceFactory] Failed to decrypt credentials:",
+            decryptError
+          );
+        }
         return null;
       }
     } catch (error) {
@@ -625,6 +638,7 @@ export class UnifiedMexcServiceFactory {
    */
   invalidateUserCredentials(userId: string): void {
     this.credentialCache.invalidate(userId);
+    clearUserCredentialsCache(userId);
     console.info(
       `[UnifiedMexcServiceFactory] Invalidated credentials cache for user: ${userId}`
     );
@@ -636,6 +650,7 @@ export class UnifiedMexcServiceFactory {
   clearAllCaches(): void {
     this.credentialCache.clear();
     this.serviceCache.clear();
+    clearUserCredentialsCache();
     console.info("[UnifiedMexcServiceFactory] Cleared all caches");
   }
 
@@ -1,6 +1,9 @@
 import { and, eq } from "drizzle-orm";
 import { apiCredentials, db } from "@/src/db";
-import { getEncryptionService } from "./secure-encryption-service";
+import {
+  DecryptionError,
+  getEncryptionService,
+} from "./secure-encryption-service";
 
 export interface DecryptedCredentials {
   apiKey: string;
@@ -11,6 +14,40 @@ export interface DecryptedCredentials {
   lastUsed?: Date;
 }
 
+// Active credentials are read on every authenticated MEXC call but rotate
+// rarely, so keep the decrypted result briefly instead of re-querying and
+// re-decrypting each time
+const credentialsCache = new Map<
+  string,
+  { credentials: DecryptedCredentials; timestamp: number }
+>();
+const CREDENTIALS_CACHE_TTL = 60 * 1000; // 1 minute
+
+/**
+ * Drop cached credentials for one user, or for everyone when no userId is
+ * given. Called from UnifiedMexcServiceFactory when credentials change.
+ */
+export function clearUserCredentialsCache(userId?: string): void {
+  if (!userId) {
+    credentialsCache.clear();
+    return;
+  }
+  for (const key of credentialsCache.keys()) {
+    if (key.startsWith(`${userId}:`)) {
+      credentialsCache.delete(key);
+    }
+  }
+}
+
+async function touchLastUsed(
+  credentialsId: typeof apiCredentials.$inferSelect.id
+): Promise<void> {
+  await db
+    .update(apiCredentials)
+    .set({ lastUsed: new Date() })
+    .where(eq(apiCredentials.id, credentialsId));
+}
+
 /**
  * Get decrypted API credentials for a specific user and provider
  */
@@ -18,10 +55,24 @@ export async function getUserCredentials(
   userId: string,
   provider = "mexc"
 ): Promise<DecryptedCredentials | null> {
+  const cacheKey = `${userId}:${provider}`;
+  const cached = credentialsCache.get(cacheKey);
+  if (cached && Date.now() - cached.timestamp < CREDENTIALS_CACHE_TTL) {
+    return cached.credentials;
+  }
+
   try {
-    // Query the database for user credentials
+    // Query the database for user credentials (only the columns used below)
     const result = await db
-      .select()
+      .select({
+        id: apiCredentials.id,
+        provider: apiCredentials.provider,
+        isActive: apiCredentials.isActive,
+        lastUsed: apiCredentials.lastUsed,
+        encryptedApiKey: apiCredentials.encryptedApiKey,
+        encryptedSecretKey: apiCredentials.encryptedSecretKey,
+        encryptedPassphrase: apiCredentials.encryptedPassphrase,
+      })
       .from(apiCredentials)
       .where(
         and(
@@ -67,29 +118,37 @@ export async function getUserCredentials(
     let passphrase: string | undefined;
 
     try {
-      apiKey = encryptionService.decrypt(creds.encryptedApiKey);
-      secretKey = encryptionService.decrypt(creds.encryptedSecretKey);
-
-      if (creds.encryptedPassphrase) {
-        passphrase = encryptionService.decrypt(creds.encryptedPassphrase);
-      }
+      [apiKey, secretKey, passphrase] = await Promise.all([
+        encryptionService.decryptAsync(creds.encryptedApiKey),
+        encryptionService.decryptAsync(creds.encryptedSecretKey),
+        creds.encryptedPassphrase
+          ? encryptionService.decryptAsync(creds.encryptedPassphrase)
+          : undefined,
+      ]);
     } catch (decryptError) {
-      console.error(
-        `[UserCredentialsService] Failed to decrypt credentials for user ${userId}:`,
-        decryptError
+      if (!(decryptError instanceof DecryptionError)) {
+        throw decryptError;
+      }
+      console.warn(
+        `[UserCredentialsService] Failed to decrypt credentials for user ${userId}`
       );
-      throw new Error(
+      throw new DecryptionError(
         "Failed to decrypt API credentials - encryption key may be incorrect"
       );
     }
 
-    // Update last used timestamp
-    await db
-      .update(apiCredentials)
-      .set({ lastUsed: new Date() })
-      .where(eq(apiCredentials.id, creds.id));
+    // Only credentials that actually decrypted count as used. A failed
+    // timestamp update must not fail the credential lookup.
+    try {
+      await touchLastUsed(creds.id);
+    } catch (updateError) {
+      console.warn(
+        `[UserCredentialsService] Failed to update lastUsed for user ${userId}:`,
+        updateError
+      );
+    }
 
-    return {
+    const credentials: DecryptedCredentials = {
       apiKey,
       secretKey,
       passphrase,
@@ -97,11 +156,17 @@ export async function getUserCredentials(
       isActive: creds.isActive,
       lastUsed: creds.lastUsed || undefined,
     };
+    credentialsCache.set(cacheKey, { credentials, timestamp: Date.now() });
+
+    return credentials;
   } catch (error) {
-    console.error(
-      `[UserCredentialsService] Error getting credentials for user ${userId}:`,
-      error
-    );
+    // Decryption failures were already reported above
+    if (!(error instanceof DecryptionError)) {
+      console.error(
+        `[UserCredentialsService] Error getting credentials for user ${userId}:`,
+        error
+      );
+    }
     throw error;
   }
 }
@@ -129,10 +129,21 @@ export class CalendarToDatabaseSyncService {
         `📅 Found ${calendarEntries.length} total launches, ${qualifyingLaunches.length} qualifying`
       );
 
-      // 3. Process each qualifying launch
+      // 3. Process each qualifying launch, loading the existing targets for
+      // all of them in one query rather than one lookup per launch
+      const existingTargetIds = await this.loadExistingTargetIds(
+        qualifyingLaunches,
+        userId
+      );
       for (const launch of qualifyingLaunches) {
         try {
-          await this.processLaunch(launch, userId, dryRun, result);
+          await this.processLaunch(
+            launch,
+            userId,
+            dryRun,
+            result,
+            existingTargetIds
+          );
         } catch (error) {
           const errorMsg = `Failed to process launch ${launch.vcoinId}: ${error instanceof Error ? error.message : "Unknown error"}`;
           result.errors.push(errorMsg);
@@ -221,6 +232,39 @@ export class CalendarToDatabaseSyncService {
     });
   }
 
+  /**
+   * Map vcoinId to the id of the user's existing snipe target, if any
+   */
+  private async loadExistingTargetIds(
+    launches: CalendarEntry[],
+    userId: string
+  ): Promise<Map<string, number>> {
+    const existingTargetIds = new Map<string, number>();
+    if (launches.length === 0) {
+      return existingTargetIds;
+    }
+
+    const rows = await db
+      .select({ id: snipeTargets.id, vcoinId: snipeTargets.vcoinId })
+      .from(snipeTargets)
+      .where(
+        and(
+          eq(snipeTargets.userId, userId),
+          inArray(
+            snipeTargets.vcoinId,
+            launches.map((launch) => launch.vcoinId)
+          )
+        )
+      );
+
+    for (const row of rows) {
+      if (!existingTargetIds.has(row.vcoinId)) {
+        existingTargetIds.set(row.vcoinId, row.id);
+      }
+    }
+    return existingTargetIds;
+  }
+
   /**
    * Process individual launch entry
    */
@@ -228,23 +272,15 @@ export class CalendarToDatabaseSyncService {
     launch: CalendarEntry,
     userId: string,
     dryRun: boolean,
-    result: SyncResult
+    result: SyncResult,
+    existingTargetIds: Map<string, number>
   ): Promise<void> {
     const symbolName = launch.symbol || `${launch.vcoinNameFull}USDT`;
 
     // Check if target already exists
-    const existingTarget = await db
-      .select()
-      .from(snipeTargets)
-      .where(
-        and(
-          eq(snipeTargets.vcoinId, launch.vcoinId),
-          eq(snipeTargets.userId, userId)
-        )
-      )
-      .limit(1);
+    const existingTargetId = existingTargetIds.get(launch.vcoinId);
 
-    if (existingTarget.length > 0) {
+    if (existingTargetId !== undefined) {
       // Update existing target
       if (!dryRun) {
         await db
@@ -257,7 +293,7 @@ export class CalendarToDatabaseSyncService {
             riskLevel: "medium",
             updatedAt: new Date(),
           })
-          .where(eq(snipeTargets.id, existingTarget[0].id));
+          .where(eq(snipeTargets.id, existingTargetId));
       }
       result.updated++;
       console.debug(
@@ -270,14 +306,21 @@ export class CalendarToDatabaseSyncService {
           `🔧 Inserting target: vcoinId=${launch.vcoinId}, symbolName=${symbolName}, userId=${userId}`
         );
         try {
-          const insertResult = await db.insert(snipeTargets).values({
-            userId,
-            vcoinId: launch.vcoinId,
-            symbolName,
-            positionSizeUsdt: 100, // Default position size
-            stopLossPercent: 5.0, // Default 5% stop loss
-            targetExecutionTime: new Date(launch.firstOpenTime),
-          });
+          const insertResult = await db
+            .insert(snipeTargets)
+            .values({
+              userId,
+              vcoinId: launch.vcoinId,
+              symbolName,
+              positionSizeUsdt: 100, // Default position size
+              stopLossPercent: 5.0, // Default 5% stop loss
+              targetExecutionTime: new Date(launch.firstOpenTime),
+            })
+            .returning({ id: snipeTargets.id });
+          // Repeated vcoinIds later in the same sync update this row
+          if (insertResult[0]) {
+            existingTargetIds.set(launch.vcoinId, insertResult[0].id);
+          }
           console.debug(`✅ Target inserted successfully:`, insertResult);
         } catch (insertError) {
           console.error(
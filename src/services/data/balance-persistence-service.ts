@@ -183,7 +183,6 @@ export class BalancePersistenceService {
           performance24h: 0,
           performance7d: 0,
           performance30d: 0,
-          createdAt: new Date(),
         });
 
         console.info("Portfolio summary created", {
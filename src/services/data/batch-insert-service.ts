@@ -277,8 +277,6 @@ export class BatchInsertService {
         embedding: embedding.embedding,
         confidence: embedding.confidence,
         discoveredAt: embedding.discoveredAt,
-        createdAt: new Date(),
-        updatedAt: new Date(),
       }));
 
       let result;
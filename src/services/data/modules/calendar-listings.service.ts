@@ -35,9 +35,12 @@ export const CalendarEntrySchema = z.object({
   maxNotional: z.string().optional(),
 });
 
+// Built once and reused for every API response rather than per call
+const CalendarEntryListSchema = z.array(CalendarEntrySchema);
+
 export const CalendarListingsResponseSchema = z.object({
   success: z.boolean(),
-  data: z.array(CalendarEntrySchema),
+  data: CalendarEntryListSchema,
   error: z.string().optional(),
   timestamp: z.number().optional(),
   cached: z.boolean().optional(),
@@ -259,7 +262,7 @@ export class CalendarListingsService {
     const transformedData = this.transformAPIResponse(rawResponse);
 
     // Validate with Zod schema
-    const validatedData = z.array(CalendarEntrySchema).parse(transformedData);
+    const validatedData = CalendarEntryListSchema.parse(transformedData);
 
     return {
       success: true,
@@ -275,10 +278,12 @@ export class CalendarListingsService {
 
     try {
       const cached = await this.config.cache.get(cacheKey);
-      if (!cached) return null;
 
-      // Validate cached data
-      return CalendarListingsResponseSchema.parse(cached);
+      // Entries are written by cacheListings from an already validated
+      // response, so only the envelope is checked before reuse
+      if (!cached?.cached || !Array.isArray(cached.data)) return null;
+
+      return cached as CalendarListingsResponse;
     } catch (_error) {
       // Invalid cached data, ignore and fetch fresh
       return null;
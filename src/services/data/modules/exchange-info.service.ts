@@ -409,10 +409,12 @@ export class ExchangeInfoService {
 
     try {
       const cached = await this.config.cache.get(cacheKey);
-      if (!cached) return null;
 
-      // Validate cached data
-      return ExchangeInfoResponseSchema.parse(cached);
+      // Entries are written by cacheData from an already validated response,
+      // so only the envelope is checked instead of re-parsing every symbol
+      if (!cached?.cached || !Array.isArray(cached.data?.symbols)) return null;
+
+      return cached as ExchangeInfoResponse;
     } catch (_error) {
       // Invalid cached data, ignore and fetch fresh
       return null;
@@ -62,6 +62,7 @@ export class MexcCacheLayer {
   };
 
   private cache = new Map<string, CacheEntry<any>>();
+  private inflight = new Map<string, Promise<MexcServiceResponse<any>>>();
   private config: MexcCacheConfig;
   private metrics: CacheMetrics;
   private cleanupInterval?: NodeJS.Timeout;
@@ -204,15 +205,9 @@ export class MexcCacheLayer {
         };
       }
 
-      // Execute function and cache result
-      const result = await fn();
-
-      // Only cache successful responses
-      if (result.success) {
+      return this.loadOnce(key, fn, (result) => {
         this.set(key, result, ttlType);
-      }
-
-      return result;
+      });
     };
   }
 
@@ -234,18 +229,42 @@ export class MexcCacheLayer {
         };
       }
 
-      // Execute function and cache result
-      const result = await fn();
-
-      // Only cache successful responses
-      if (result.success) {
+      return this.loadOnce(key, fn, (result) => {
         this.setWithCustomTTL(key, result, customTTL);
-      }
-
-      return result;
+      });
     };
   }
 
+  /**
+   * Execute the loader for a missed key, sharing a single in-flight call
+   * between concurrent callers that miss the same key. Only successful
+   * responses are stored.
+   */
+  private loadOnce<T>(
+    key: string,
+    fn: () => Promise<MexcServiceResponse<T>>,
+    store: (result: MexcServiceResponse<T>) => void
+  ): Promise<MexcServiceResponse<T>> {
+    const pending = this.inflight.get(key);
+    if (pending) {
+      return pending as Promise<MexcServiceResponse<T>>;
+    }
+
+    const load = fn()
+      .then((result) => {
+        if (result.success) {
+          store(result);
+        }
+        return result;
+      })
+      .finally(() => {
+        this.inflight.delete(key);
+      });
+
+    this.inflight.set(key, load);
+    return load;
+  }
+
   /**
    * Get or set pattern for common cache operations
    */
@@ -278,14 +297,24 @@ export class MexcCacheLayer {
    * Invalidate cache entries by pattern
    */
   invalidateByPattern(pattern: string): number {
+    return this.invalidateByPatterns([pattern]);
+  }
+
+  /**
+   * Invalidate cache entries matching any of the patterns in a single pass
+   * over the keys
+   */
+  invalidateByPatterns(patterns: string[]): number {
     let invalidated = 0;
 
-    Array.from(this.cache.keys()).forEach((key) => {
-      if (key.includes(pattern)) {
+    // Deleting the current key while iterating a Map is safe, so there is
+    // no need to snapshot the key list first
+    for (const key of this.cache.keys()) {
+      if (patterns.some((pattern) => key.includes(pattern))) {
         this.cache.delete(key);
         invalidated++;
       }
-    });
+    }
 
     this.metrics.deletions += invalidated;
     return invalidated;
@@ -309,11 +338,7 @@ export class MexcCacheLayer {
    * Invalidate all user-specific cache
    */
   invalidateUserData(): number {
-    return (
-      this.invalidateByPattern("account") +
-      this.invalidateByPattern("balance") +
-      this.invalidateByPattern("portfolio")
-    );
+    return this.invalidateByPatterns(["account", "balance", "portfolio"]);
   }
 
   // ============================================================================
@@ -327,12 +352,12 @@ export class MexcCacheLayer {
     const now = Date.now();
     let cleaned = 0;
 
-    Array.from(this.cache.entries()).forEach(([key, entry]) => {
+    for (const [key, entry] of this.cache) {
       if (now - entry.timestamp > entry.ttl) {
         this.cache.delete(key);
         cleaned++;
       }
-    });
+    }
 
     if (cleaned > 0) {
       this.metrics.evictions += cleaned;
@@ -450,9 +450,11 @@ export class PortfolioService {
 
     try {
       const cached = await this.config.cache.get(cacheKey);
-      if (!cached) return null;
 
-      return PortfolioResponseSchema.parse(cached);
+      // Written by cachePortfolio from a validated portfolio; skip re-parsing
+      if (!cached?.cached || !Array.isArray(cached.data?.balances)) return null;
+
+      return cached as PortfolioResponse;
     } catch (_error) {
       return null;
     }
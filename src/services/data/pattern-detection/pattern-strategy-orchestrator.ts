@@ -11,7 +11,7 @@
  * - Strategy Agent creates trading plans
  */
 
-import { and, desc, eq, gte } from "drizzle-orm";
+import { and, desc, eq, gte, sql } from "drizzle-orm";
 import {
   type PatternAnalysisResult,
   PatternDetectionCore,
@@ -919,45 +919,68 @@ export class PatternStrategyOrchestrator {
     patterns: PatternMatch[]
   ): Promise<void> {
     try {
+      // Collect one row per listing and upsert them in a single statement.
+      // A listing seen twice in the same batch keeps its first row and takes
+      // the later pattern readings, as the old row-by-row upserts did.
+      const rowsByVcoinId = new Map<
+        string,
+        typeof monitoredListings.$inferInsert
+      >();
+      const now = new Date();
+
       for (const pattern of patterns) {
         if (
           (pattern.patternType === "launch_sequence" ||
             pattern.patternType === "ready_state") &&
           pattern.advanceNoticeHours >= 3.5
         ) {
+          const vcoinId = pattern.vcoinId || pattern.symbol;
+          const existing = rowsByVcoinId.get(vcoinId);
+          if (existing) {
+            existing.confidence = pattern.confidence;
+            existing.patternSts = pattern.indicators.sts;
+            existing.patternSt = pattern.indicators.st;
+            existing.patternTt = pattern.indicators.tt;
+            existing.hasReadyPattern = true;
+            continue;
+          }
+
           // Store in monitored listings for tracking
-          await db
-            .insert(monitoredListings)
-            .values({
-              vcoinId: pattern.vcoinId || pattern.symbol,
-              symbolName: pattern.symbol,
-              firstOpenTime:
-                Date.now() + pattern.advanceNoticeHours * 60 * 60 * 1000,
-              status: "monitoring",
-              confidence: pattern.confidence,
-              patternSts: pattern.indicators.sts,
-              patternSt: pattern.indicators.st,
-              patternTt: pattern.indicators.tt,
-              hasReadyPattern: pattern.patternType === "ready_state",
-              lastChecked: new Date(),
-            })
-            .onConflictDoUpdate({
-              target: monitoredListings.vcoinId,
-              set: {
-                confidence: pattern.confidence,
-                patternSts: pattern.indicators.sts,
-                patternSt: pattern.indicators.st,
-                patternTt: pattern.indicators.tt,
-                hasReadyPattern:
-                  pattern.patternType === "ready_state" ||
-                  pattern.patternType === "launch_sequence",
-                lastChecked: new Date(),
-                updatedAt: new Date(),
-              },
-            });
+          rowsByVcoinId.set(vcoinId, {
+            vcoinId,
+            symbolName: pattern.symbol,
+            firstOpenTime:
+              Date.now() + pattern.advanceNoticeHours * 60 * 60 * 1000,
+            status: "monitoring",
+            confidence: pattern.confidence,
+            patternSts: pattern.indicators.sts,
+            patternSt: pattern.indicators.st,
+            patternTt: pattern.indicators.tt,
+            hasReadyPattern: pattern.patternType === "ready_state",
+            lastChecked: now,
+          });
         }
       }
 
+      if (rowsByVcoinId.size > 0) {
+        await db
+          .insert(monitoredListings)
+          .values([...rowsByVcoinId.values()])
+          .onConflictDoUpdate({
+            target: monitoredListings.vcoinId,
+            set: {
+              confidence: sql`excluded.confidence`,
+              patternSts: sql`excluded.pattern_sts`,
+              patternSt: sql`excluded.pattern_st`,
+              patternTt: sql`excluded.pattern_tt`,
+              // Only launch_sequence and ready_state patterns get here
+              hasReadyPattern: true,
+              lastChecked: now,
+              updatedAt: now,
+            },
+          });
+      }
+
       console.info(
         `[PatternOrchestrator] Stored ${patterns.length} patterns in database`
       );
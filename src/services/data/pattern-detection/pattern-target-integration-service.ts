@@ -6,7 +6,7 @@
  * snipe targets in the database for auto-sniping execution.
  */
 
-import { and, eq, inArray } from "drizzle-orm";
+import { and, count, eq, inArray } from "drizzle-orm";
 import type { PatternMatch } from "@/src/core/pattern-detection/interfaces";
 import { db } from "@/src/db";
 import { snipeTargets } from "@/src/db/schemas/supabase-auth";
@@ -420,24 +420,28 @@ export class PatternTargetIntegrationService {
     pendingTargets: number;
     executingTargets: number;
   }> {
-    let baseQuery = db.select().from(snipeTargets);
-
-    if (userId) {
-      baseQuery = baseQuery.where(eq(snipeTargets.userId, userId));
+    // Count per status in the database instead of loading every target row
+    const statusCounts = await db
+      .select({ status: snipeTargets.status, count: count() })
+      .from(snipeTargets)
+      .where(userId ? eq(snipeTargets.userId, userId) : undefined)
+      .groupBy(snipeTargets.status);
+
+    const countsByStatus = new Map<string, number>();
+    let totalTargetsCreated = 0;
+    for (const row of statusCounts) {
+      countsByStatus.set(row.status, row.count);
+      totalTargetsCreated += row.count;
     }
-
-    const allTargets = await baseQuery;
+    const countFor = (status: string) => countsByStatus.get(status) ?? 0;
 
     return {
-      totalTargetsCreated: allTargets.length,
-      activeTargets: allTargets.filter((t: any) =>
-        ["pending", "ready", "executing"].includes(t.status)
-      ).length,
-      readyTargets: allTargets.filter((t: any) => t.status === "ready").length,
-      pendingTargets: allTargets.filter((t: any) => t.status === "pending")
-        .length,
-      executingTargets: allTargets.filter((t: any) => t.status === "executing")
-        .length,
+      totalTargetsCreated,
+      activeTargets:
+        countFor("pending") + countFor("ready") + countFor("executing"),
+      readyTargets: countFor("ready"),
+      pendingTargets: countFor("pending"),
+      executingTargets: countFor("executing"),
     };
   }
 }
@@ -66,6 +66,7 @@ const SnipeTargetRecordSchema = z.object({
 });
 
 type SnipeTargetRecord = z.infer<typeof SnipeTargetRecordSchema>;
+type UserPreferencesRow = typeof userPreferences.$inferSelect;
 
 // ============================================================================
 // Pattern to Database Bridge Service
@@ -81,6 +82,13 @@ export class PatternToDatabaseBridge {
   private config: BridgeConfig;
   private patternDetectionCore: EnhancedPatternDetectionCore;
   private processedPatterns = new Set<string>(); // Deduplication cache
+  // Preferences are looked up for every converted pattern, usually for the
+  // same user, so cache them briefly
+  private userPreferencesCache = new Map<
+    string,
+    { preferences: UserPreferencesRow | null; expiresAt: number }
+  >();
+  private readonly userPreferencesCacheTTL = 60 * 1000; // 1 minute
 
   private constructor(config?: Partial<BridgeConfig>) {
     this.config = BridgeConfigSchema.parse(config || {});
@@ -474,7 +482,14 @@ export class PatternToDatabaseBridge {
   /**
    * Get user preferences for position sizing and risk management
    */
-  private async getUserPreferences(userId: string) {
+  private async getUserPreferences(
+    userId: string
+  ): Promise<UserPreferencesRow | null> {
+    const cached = this.userPreferencesCache.get(userId);
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.preferences;
+    }
+
     try {
       const [userPref] = await db
         .select()
@@ -482,7 +497,12 @@ export class PatternToDatabaseBridge {
         .where(eq(userPreferences.userId, userId))
         .limit(1);
 
-      return userPref;
+      const preferences = userPref ?? null;
+      this.userPreferencesCache.set(userId, {
+        preferences,
+        expiresAt: Date.now() + this.userPreferencesCacheTTL,
+      });
+      return preferences;
     } catch (error) {
       this.logger.warn("Failed to fetch user preferences, using defaults", {
         userId,
@@ -566,7 +586,7 @@ export class PatternToDatabaseBridge {
         // Single record - use simple query
         const record = records[0];
         const existing = await db
-          .select()
+          .select({ id: snipeTargets.id })
           .from(snipeTargets)
           .where(
             and(
@@ -585,9 +605,13 @@ export class PatternToDatabaseBridge {
         const userIds = [...new Set(records.map((r) => r.userId))];
         const symbols = [...new Set(records.map((r) => r.symbolName))];
 
-        // Single query to get all existing targets for all users and symbols
+        // Single query to get all existing targets for all users and symbols,
+        // reading only the columns the duplicate check needs
         const existingTargets = await db
-          .select()
+          .select({
+            userId: snipeTargets.userId,
+            symbolName: snipeTargets.symbolName,
+          })
           .from(snipeTargets)
           .where(
             and(
@@ -600,7 +624,7 @@ export class PatternToDatabaseBridge {
         // Create lookup set for O(1) duplicate checking
         const existingCombinations = new Set(
           existingTargets.map(
-            (target: any) => `${target.userId}:${target.symbolName}`
+            (target) => `${target.userId}:${target.symbolName}`
           )
         );
 
@@ -758,11 +782,20 @@ export class PatternToDatabaseBridge {
     };
   }
 
+  /**
+   * Drop the cached preferences for a user after their preferences change,
+   * so new snipe targets pick up the update immediately
+   */
+  invalidateUserPreferences(userId: string): void {
+    this.userPreferencesCache.delete(userId);
+  }
+
   /**
    * Clear processed patterns cache
    */
   clearCache(): void {
     this.processedPatterns.clear();
+    this.userPreferencesCache.clear();
     this.logger.info("Processed patterns cache cleared");
   }
 }
@@ -19,6 +19,8 @@ import { getActivityDataForSymbol } from "./activity-integration";
 import type { PatternMatch } from "./pattern-types";
 import { PATTERN_CONSTANTS } from "./pattern-types";
 
+const READY_STATE_PATTERN = PATTERN_CONSTANTS.READY_STATE_PATTERN;
+
 export interface ReadyStateDetectorOptions {
   forceEmitEvents?: boolean;
 }
@@ -67,10 +69,14 @@ export class ReadyStateDetector extends BrowserCompatibleEventEmitter {
     const isTestEnv =
       process.env.NODE_ENV === "test" || process.env.VITEST === "true";
 
-    for (const symbol of symbols) {
-      // Core ready state pattern validation
-      const isExactMatch = this.validateExactReadyState(symbol);
+    // Only exact sts:2, st:2, tt:4 matches can produce a pattern, so apply the
+    // cheap predicate first and skip activity lookups / confidence scoring for
+    // the (usually vast) majority of symbols that are not ready
+    const readySymbols = symbols.filter((symbol) =>
+      this.validateExactReadyState(symbol)
+    );
 
+    for (const symbol of readySymbols) {
       // Get activity data and calculate confidence in parallel for 2x faster processing
       const symbolName = symbol.cd || "unknown";
       const vcoinId = (symbol as any).vcoinId;
@@ -82,7 +88,7 @@ export class ReadyStateDetector extends BrowserCompatibleEventEmitter {
           : this.calculateReadyStateConfidence(symbol),
       ]);
 
-      if (isExactMatch && confidence >= 85) {
+      if (confidence >= 85) {
         // Store successful pattern for future learning (skip in test environment for speed)
         if (!isTestEnv) {
           await this.storeSuccessfulPattern(symbol, "ready_state", confidence);
@@ -433,7 +439,11 @@ export class ReadyStateDetector extends BrowserCompatibleEventEmitter {
   // ============================================================================
 
   private validateExactReadyState(symbol: SymbolEntry): boolean {
-    return symbol.sts === 2 && symbol.st === 2 && symbol.tt === 4;
+    return (
+      symbol.sts === READY_STATE_PATTERN.sts &&
+      symbol.st === READY_STATE_PATTERN.st &&
+      symbol.tt === READY_STATE_PATTERN.tt
+    );
   }
 
   /**
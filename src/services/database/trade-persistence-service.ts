@@ -78,6 +78,35 @@ export interface BalanceSnapshotData {
   dataSource?: "api" | "manual" | "calculated";
 }
 
+// Map trade execution data onto an execution_history row
+function toExecutionHistoryRow(data: TradeExecutionData): NewExecutionHistory {
+  return {
+    userId: data.userId,
+    snipeTargetId: data.snipeTargetId || null,
+    vcoinId: data.vcoinId,
+    symbolName: data.symbolName,
+    action: data.action,
+    orderType: data.orderType,
+    orderSide: data.orderSide,
+    requestedQuantity: data.requestedQuantity,
+    requestedPrice: data.requestedPrice || null,
+    executedQuantity: data.executedQuantity || null,
+    executedPrice: data.executedPrice || null,
+    totalCost: data.totalCost || null,
+    fees: data.fees || null,
+    exchangeOrderId: data.exchangeOrderId || null,
+    exchangeStatus: data.exchangeStatus || null,
+    exchangeResponse: data.exchangeResponse || null,
+    executionLatencyMs: data.executionLatencyMs || null,
+    slippagePercent: data.slippagePercent || null,
+    status: data.status,
+    errorCode: data.errorCode || null,
+    errorMessage: data.errorMessage || null,
+    requestedAt: data.requestedAt,
+    executedAt: data.executedAt || null,
+  };
+}
+
 export class TradePersistenceService {
   private logger = {
     info: (message: string, context?: any) => {
@@ -107,31 +136,7 @@ export class TradePersistenceService {
         status: data.status,
       });
 
-      const executionData: NewExecutionHistory = {
-        userId: data.userId,
-        snipeTargetId: data.snipeTargetId || null,
-        vcoinId: data.vcoinId,
-        symbolName: data.symbolName,
-        action: data.action,
-        orderType: data.orderType,
-        orderSide: data.orderSide,
-        requestedQuantity: data.requestedQuantity,
-        requestedPrice: data.requestedPrice || null,
-        executedQuantity: data.executedQuantity || null,
-        executedPrice: data.executedPrice || null,
-        totalCost: data.totalCost || null,
-        fees: data.fees || null,
-        exchangeOrderId: data.exchangeOrderId || null,
-        exchangeStatus: data.exchangeStatus || null,
-        exchangeResponse: data.exchangeResponse || null,
-        executionLatencyMs: data.executionLatencyMs || null,
-        slippagePercent: data.slippagePercent || null,
-        status: data.status,
-        errorCode: data.errorCode || null,
-        errorMessage: data.errorMessage || null,
-        requestedAt: data.requestedAt,
-        executedAt: data.executedAt || null,
-      };
+      const executionData = toExecutionHistoryRow(data);
 
       const result = await db
         .insert(executionHistory)
@@ -517,7 +517,9 @@ export class AutomatedAlertingService {
   ): Promise<void> {
     const now = new Date();
 
-    await this.db
+    // RETURNING gives us the updated row for notifications in the same
+    // round trip instead of re-selecting it
+    const alert = await this.db
       .update(alertInstances)
       .set({
         status: "resolved",
@@ -525,15 +527,10 @@ export class AutomatedAlertingService {
         resolvedBy,
         resolutionNotes: notes,
       })
-      .where(eq(alertInstances.id, alertId));
-
-    // Send resolution notifications
-    const alert = await this.db
-      .select()
-      .from(alertInstances)
       .where(eq(alertInstances.id, alertId))
-      .limit(1);
+      .returning();
 
+    // Send resolution notifications
     if (alert.length > 0) {
       await this.notificationService.sendResolutionNotifications(alert[0]);
     }
@@ -58,6 +58,9 @@ export class NotificationService {
   private db: any;
   private providers: Map<string, NotificationProvider> = new Map();
   private rateLimitCache: Map<string, number[]> = new Map();
+  // Decoded channel filter JSON, keyed by the raw column value so an edited
+  // channel simply misses and re-parses
+  private channelFilterCache: Map<string, unknown> = new Map();
   private tracer = trace.getTracer("notification-service");
   private _logger: any;
 
@@ -382,6 +385,19 @@ export class NotificationService {
       .map((result) => result.channel);
   }
 
+  private parseChannelFilter<T>(json: string): T {
+    if (this.channelFilterCache.has(json)) {
+      return this.channelFilterCache.get(json) as T;
+    }
+
+    const parsed = JSON.parse(json);
+    if (this.channelFilterCache.size >= 500) {
+      this.channelFilterCache.clear();
+    }
+    this.channelFilterCache.set(json, parsed);
+    return parsed;
+  }
+
   private async channelMatchesAlert(
     channel: SelectNotificationChannel,
     alert: SelectAlertInstance
@@ -389,7 +405,9 @@ export class NotificationService {
     // Check severity filter
     if (channel.severityFilter) {
       try {
-        const severities = JSON.parse(channel.severityFilter);
+        const severities = this.parseChannelFilter<string[]>(
+          channel.severityFilter
+        );
         if (!severities.includes(alert.severity)) {
           return false;
         }
@@ -405,7 +423,9 @@ export class NotificationService {
     // Check category filter
     if (channel.categoryFilter) {
       try {
-        const categories = JSON.parse(channel.categoryFilter);
+        const categories = this.parseChannelFilter<string[]>(
+          channel.categoryFilter
+        );
         // Get rule to check category by joining with alert rules
         try {
           const { alertRules } = await import("@/src/db/schemas/alerts");
@@ -436,7 +456,7 @@ export class NotificationService {
     // Check tag filter
     if (channel.tagFilter && alert.labels) {
       try {
-        const tagFilter = JSON.parse(channel.tagFilter);
+        const tagFilter = this.parseChannelFilter<string[]>(channel.tagFilter);
         const alertLabels = JSON.parse(alert.labels);
 
         const hasMatchingTag = tagFilter.some((tag: string) =>
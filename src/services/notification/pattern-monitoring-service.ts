@@ -100,16 +100,22 @@ export class PatternMonitoringService {
   // Monitoring state
   private isMonitoring = false;
   private monitoringInterval: NodeJS.Timeout | null = null;
+  private cycleInFlight: Promise<void> | null = null;
   private stats: PatternMonitoringStats;
   private recentActivity: RecentPatternActivity[] = [];
   private activeAlerts: PatternAlert[] = [];
   private patternHistory: PatternMatch[] = [];
+  private reportCache: {
+    expiresAt: number;
+    report: PatternMonitoringReport;
+  } | null = null;
 
   // Configuration
   private readonly maxRecentActivity = 50;
   private readonly maxPatternHistory = 1000;
   private readonly monitoringIntervalMs = 30000; // 30 seconds
   private readonly confidenceThreshold = 80; // Alert on patterns above 80% confidence
+  private readonly reportCacheTtlMs = 15000; // Reuse reports between detection runs
 
   private constructor() {
     this.patternEngine = PatternDetectionCore.getInstance();
@@ -153,14 +159,15 @@ export class PatternMonitoringService {
     );
     this.isMonitoring = true;
     this.stats.engineStatus = "active";
+    this.invalidateReportCache();
 
     // Start monitoring loop
     this.monitoringInterval = setInterval(async () => {
-      await this.performMonitoringCycle();
+      await this.runMonitoringCycle();
     }, this.monitoringIntervalMs);
 
     // Perform initial monitoring cycle
-    await this.performMonitoringCycle();
+    await this.runMonitoringCycle();
   }
 
   /**
@@ -174,6 +181,7 @@ export class PatternMonitoringService {
     console.info("[PatternMonitoring] Stopping pattern monitoring...");
     this.isMonitoring = false;
     this.stats.engineStatus = "idle";
+    this.invalidateReportCache();
 
     if (this.monitoringInterval) {
       clearInterval(this.monitoringInterval);
@@ -185,6 +193,12 @@ export class PatternMonitoringService {
    * Get current monitoring status and statistics
    */
   async getMonitoringReport(): Promise<PatternMonitoringReport> {
+    // Safety monitors and the dashboard poll this frequently; serve the
+    // cached report until the TTL lapses or new detection results arrive.
+    if (this.reportCache && this.reportCache.expiresAt > Date.now()) {
+      return this.reportCache.report;
+    }
+
     // Update time-based metrics
     this.updateTimeBasedMetrics();
 
@@ -194,21 +208,27 @@ export class PatternMonitoringService {
     // Determine overall status
     const status = this.determineOverallStatus();
 
-    return {
+    const report: PatternMonitoringReport = {
       status,
       stats: { ...this.stats },
-      recentActivity: [...this.recentActivity].slice(-10), // Last 10 activities
+      recentActivity: this.recentActivity.slice(-10), // Last 10 activities
       activeAlerts: [...this.activeAlerts],
       recommendations,
       lastUpdated: new Date().toISOString(),
     };
+
+    this.reportCache = {
+      expiresAt: Date.now() + this.reportCacheTtlMs,
+      report,
+    };
+    return report;
   }
 
   /**
    * Get recent pattern matches
    */
   getRecentPatterns(limit = 20): PatternMatch[] {
-    return [...this.patternHistory].slice(-limit);
+    return this.patternHistory.slice(-limit);
   }
 
   /**
@@ -272,6 +292,8 @@ export class PatternMonitoringService {
       console.error("[PatternMonitoring] Manual detection failed:", error);
       this.stats.consecutiveErrors++;
       throw error;
+    } finally {
+      this.invalidateReportCache();
     }
   }
 
@@ -282,6 +304,7 @@ export class PatternMonitoringService {
     const alert = this.activeAlerts.find((a) => a.id === alertId);
     if (alert) {
       alert.acknowledged = true;
+      this.invalidateReportCache();
       return true;
     }
     return false;
@@ -295,6 +318,7 @@ export class PatternMonitoringService {
     this.activeAlerts = this.activeAlerts.filter(
       (alert) => !alert.acknowledged
     );
+    this.invalidateReportCache();
     return initialCount - this.activeAlerts.length;
   }
 
@@ -304,6 +328,7 @@ export class PatternMonitoringService {
   clearAllAlerts(): number {
     const clearedCount = this.activeAlerts.length;
     this.activeAlerts = [];
+    this.invalidateReportCache();
     return clearedCount;
   }
 
@@ -342,6 +367,22 @@ export class PatternMonitoringService {
       clearInterval(this.monitoringInterval);
       this.monitoringInterval = null;
     }
+
+    this.invalidateReportCache();
+  }
+
+  /**
+   * Run a monitoring cycle unless one is already in flight.
+   * A slow cycle must not overlap the next interval tick, otherwise two
+   * cycles mutate stats/history concurrently and double the MEXC load.
+   */
+  private runMonitoringCycle(): Promise<void> {
+    if (!this.cycleInFlight) {
+      this.cycleInFlight = this.performMonitoringCycle().finally(() => {
+        this.cycleInFlight = null;
+      });
+    }
+    return this.cycleInFlight;
   }
 
   /**
@@ -410,23 +451,40 @@ export class PatternMonitoringService {
         this.stats.consecutiveErrors > 3 ? "error" : "active";
     } finally {
       this.stats.lastHealthCheck = new Date().toISOString();
+      this.invalidateReportCache();
     }
   }
 
+  /**
+   * Drop the cached report so the next request reflects fresh results
+   */
+  private invalidateReportCache(): void {
+    this.reportCache = null;
+  }
+
   /**
    * Filter symbols to likely pattern candidates for performance
    */
   private filterCandidateSymbols(symbols: SymbolEntry[]): SymbolEntry[] {
-    return symbols
-      .filter((symbol) => {
-        // Look for symbols with ready state indicators or approaching ready state
-        const isNearReady = symbol.sts === 1 || symbol.sts === 2;
-        const isActive = symbol.st === 1 || symbol.st === 2;
-        const hasValidTradingTime = symbol.tt >= 3;
-
-        return isNearReady && isActive && hasValidTradingTime;
-      })
-      .slice(0, 100); // Limit to 100 symbols for performance
+    const maxCandidates = 100; // Limit to 100 symbols for performance
+    const candidates: SymbolEntry[] = [];
+
+    // Stop scanning once the cap is reached instead of filtering the full list
+    for (const symbol of symbols) {
+      // Look for symbols with ready state indicators or approaching ready state
+      const isNearReady = symbol.sts === 1 || symbol.sts === 2;
+      const isActive = symbol.st === 1 || symbol.st === 2;
+      const hasValidTradingTime = symbol.tt >= 3;
+
+      if (isNearReady && isActive && hasValidTradingTime) {
+        candidates.push(symbol);
+        if (candidates.length >= maxCandidates) {
+          break;
+        }
+      }
+    }
+
+    return candidates;
   }
 
   /**
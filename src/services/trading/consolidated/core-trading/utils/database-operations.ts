@@ -209,8 +209,6 @@ export class DatabaseOperations {
     try {
       const newTarget = {
         ...targetData,
-        createdAt: new Date(),
-        updatedAt: new Date(),
         status: targetData.status || "pending",
       };
 
@@ -281,7 +281,11 @@ export class MexcTradingService {
 
       // Get API credentials from database
       const credentials = await db
-        .select()
+        .select({
+          encryptedApiKey: apiCredentials.encryptedApiKey,
+          encryptedSecretKey: apiCredentials.encryptedSecretKey,
+          encryptedPassphrase: apiCredentials.encryptedPassphrase,
+        })
         .from(apiCredentials)
         .where(
           and(
@@ -0,0 +1,122 @@
+/**
+ * Unit tests for SecureEncryptionService
+ * Tests the stored envelope format, base64-wrapped legacy records and key caching
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { pbkdf2, pbkdf2Sync } from 'node:crypto';
+import { SecureEncryptionService } from '../../../../src/services/api/secure-encryption-service';
+
+// Keep the real crypto but count key derivations
+vi.mock('node:crypto', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('node:crypto')>();
+  return {
+    ...actual,
+    pbkdf2: vi.fn(actual.pbkdf2),
+    pbkdf2Sync: vi.fn(actual.pbkdf2Sync),
+  };
+});
+
+describe('SecureEncryptionService', () => {
+  let originalMasterKey: string | undefined;
+  let service: SecureEncryptionService;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    originalMasterKey = process.env.ENCRYPTION_MASTER_KEY;
+    process.env.ENCRYPTION_MASTER_KEY = Buffer.alloc(32, 7).toString('base64');
+    service = new SecureEncryptionService();
+  });
+
+  afterEach(() => {
+    if (originalMasterKey === undefined) {
+      delete process.env.ENCRYPTION_MASTER_KEY;
+    } else {
+      process.env.ENCRYPTION_MASTER_KEY = originalMasterKey;
+    }
+  });
+
+  describe('envelope format', () => {
+    it('should store the JSON envelope without a base64 wrapper', () => {
+      const encrypted = service.encrypt('api-secret');
+
+      expect(encrypted.startsWith('{')).toBe(true);
+      expect(service.isValidEncryptedFormat(encrypted)).toBe(true);
+      expect(service.decrypt(encrypted)).toBe('api-secret');
+    });
+
+    it('should round-trip through the async variants', async () => {
+      const encrypted = await service.encryptAsync('api-secret');
+
+      expect(encrypted.startsWith('{')).toBe(true);
+      await expect(service.decryptAsync(encrypted)).resolves.toBe('api-secret');
+    });
+  });
+
+  describe('legacy base64-wrapped records', () => {
+    let legacyRecord: string;
+
+    beforeEach(() => {
+      // Records written before the envelope was stored directly
+      legacyRecord = Buffer.from(service.encrypt('legacy-secret')).toString(
+        'base64'
+      );
+    });
+
+    it('should recognise the legacy format as valid', () => {
+      expect(legacyRecord.startsWith('{')).toBe(false);
+      expect(service.isValidEncryptedFormat(legacyRecord)).toBe(true);
+    });
+
+    it('should decrypt legacy records', () => {
+      expect(service.decrypt(legacyRecord)).toBe('legacy-secret');
+    });
+
+    it('should decrypt legacy records asynchronously', async () => {
+      await expect(service.decryptAsync(legacyRecord)).resolves.toBe(
+        'legacy-secret'
+      );
+    });
+
+    it('should re-encrypt legacy records into the new format', () => {
+      const reencrypted = service.reencrypt(legacyRecord);
+
+      expect(reencrypted.startsWith('{')).toBe(true);
+      expect(service.decrypt(reencrypted)).toBe('legacy-secret');
+    });
+  });
+
+  describe('derived key cache', () => {
+    it('should not cache keys derived while encrypting', () => {
+      const encrypted = service.encrypt('api-secret');
+      expect(pbkdf2Sync).toHaveBeenCalledTimes(1);
+
+      service.decrypt(encrypted);
+      expect(pbkdf2Sync).toHaveBeenCalledTimes(2);
+    });
+
+    it('should reuse the derived key for repeated decrypts', () => {
+      const encrypted = service.encrypt('api-secret');
+      vi.mocked(pbkdf2Sync).mockClear();
+
+      expect(service.decrypt(encrypted)).toBe('api-secret');
+      expect(service.decrypt(encrypted)).toBe('api-secret');
+      expect(pbkdf2Sync).toHaveBeenCalledTimes(1);
+    });
+
+    it('should share cached keys between sync and async decrypts', async () => {
+      const encrypted = service.encrypt('api-secret');
+      vi.mocked(pbkdf2Sync).mockClear();
+
+      await expect(service.decryptAsync(encrypted)).resolves.toBe('api-secret');
+      await expect(service.decryptAsync(encrypted)).resolves.toBe('api-secret');
+      expect(service.decrypt(encrypted)).toBe('api-secret');
+      expect(pbkdf2).toHaveBeenCalledTimes(1);
+      expect(pbkdf2Sync).not.toHaveBeenCalled();
+    });
+  });
+
+  it('should reject text that is not an encrypted envelope', () => {
+    expect(service.isValidEncryptedFormat('not-encrypted')).toBe(false);
+  });
+});